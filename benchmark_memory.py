@@ -0,0 +1,88 @@
+"""
+Memory benchmark for YouTube Bulk Downloader
+
+Measures peak memory per tracked job: the engine's Job (kept in engine.jobs
+and the scheduler lanes) and its entry in the batch's URL set, the JobRow
+shown in the job table and the DownloadResult kept in the ResultLog. The URL strings themselves are
+allocated before measuring, since they are the input and not bookkeeping.
+
+Budget: BYTES_PER_JOB_BUDGET bytes per job with results kept in memory.
+Spilling results to JSONL (used automatically for batches of
+App.SPILL_THRESHOLD or more) removes the DownloadResult share.
+
+Usage:
+    python benchmark_memory.py [--jobs 200000] [--max-bytes-per-job 450]
+
+Exits with status 1 if the measurement exceeds the budget.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from main import DownloadResult, DownloaderEngine, ErrorCode, JobModel, JobStatus
+
+BYTES_PER_JOB_BUDGET = 450
+
+
+def measure_bytes_per_job(jobs: int, spill_path: str = None) -> float:
+    """
+    Simulate a batch where every tenth job fails, and measure peak memory.
+
+    The batch is created with DownloaderEngine.start_batch(), so the scheduler
+    and its Job records are included.
+
+    Args:
+        jobs: Number of jobs in the batch
+        spill_path: Optional JSONL file for spilling results
+
+    Returns:
+        Peak traced memory divided by the number of jobs, in bytes
+    """
+    urls = [f"https://www.youtube.com/watch?v={index:011d}" for index in range(jobs)]
+
+    engine = DownloaderEngine(tempfile.gettempdir())
+
+    tracemalloc.start()
+    model = JobModel()
+    model.reset(urls)
+    results = engine.start_batch(urls, spill_path=spill_path)
+
+    for index, url in enumerate(urls):
+        if index % 10:
+            results.append(DownloadResult(url, JobStatus.DONE))
+            model.update(index, status=JobStatus.DONE, percent=1.0)
+        else:
+            results.append(DownloadResult(url, JobStatus.FAILED, ErrorCode.NETWORK))
+            model.update(index, status=JobStatus.FAILED)
+    results.close()
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / jobs
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=200000)
+    parser.add_argument("--max-bytes-per-job", type=float, default=BYTES_PER_JOB_BUDGET)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        results = {
+            "in_memory_bytes_per_job": measure_bytes_per_job(args.jobs),
+            "spilled_bytes_per_job": measure_bytes_per_job(
+                args.jobs, os.path.join(temp_dir, "results.jsonl")
+            ),
+        }
+
+    print(json.dumps(results, indent=2))
+    sys.exit(1 if results["in_memory_bytes_per_job"] > args.max_bytes_per_job else 0)
+
+
+if __name__ == "__main__":
+    main()
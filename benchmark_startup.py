@@ -0,0 +1,130 @@
+"""
+Startup benchmark for YouTube Bulk Downloader
+
+Measures cold-start latency so regressions show up as numbers:
+- import time of main.py, from `python -X importtime`
+- time to first frame, i.e. until the main window is mapped
+
+Time to first frame needs a display. On Linux without one it runs under a
+virtual display via xvfb-run when that is installed, and is skipped otherwise.
+
+Usage:
+    python benchmark_startup.py [--runs 5] [--max-import-ms 800] [--max-frame-ms 1500]
+
+Exits with status 1 if a median exceeds its budget.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+from typing import Optional
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Run in a fresh interpreter: build the window and report once it is mapped
+FIRST_FRAME_SCRIPT = """
+import time
+start = time.perf_counter()
+import main
+app = main.App()
+def on_map(event):
+    if event.widget is app:
+        print(f"{(time.perf_counter() - start) * 1000:.1f}", flush=True)
+        app.after(0, app.destroy)
+app.bind("<Map>", on_map, add="+")
+app.mainloop()
+"""
+
+
+def measure_import_ms() -> float:
+    """
+    Measure the cumulative import time of main.py.
+
+    Returns:
+        Import time in milliseconds
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=APP_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    # Lines look like: "import time:   self [us] | cumulative | imported package"
+    for line in completed.stderr.splitlines():
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == "main":
+            return int(parts[1]) / 1000
+    raise RuntimeError("main not found in -X importtime output")
+
+
+def first_frame_command() -> Optional[list[str]]:
+    """
+    Build the command that launches the app and prints time to first frame.
+
+    Returns:
+        Command list, or None if no display is available
+    """
+    command = [sys.executable, "-c", FIRST_FRAME_SCRIPT]
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        xvfb_run = shutil.which("xvfb-run")
+        if xvfb_run is None:
+            return None
+        return [xvfb_run, "-a", *command]
+    return command
+
+
+def measure_first_frame_ms(command: list[str]) -> float:
+    """
+    Measure time from interpreter start to the main window being mapped.
+
+    Args:
+        command: Command from first_frame_command()
+
+    Returns:
+        Time to first frame in milliseconds
+    """
+    completed = subprocess.run(
+        command,
+        cwd=APP_DIR,
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=True
+    )
+    return float(completed.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-import-ms", type=float, default=800.0)
+    parser.add_argument("--max-frame-ms", type=float, default=1500.0)
+    args = parser.parse_args()
+
+    results = {}
+    import_times = [measure_import_ms() for _ in range(args.runs)]
+    results["import_ms"] = statistics.median(import_times)
+
+    command = first_frame_command()
+    if command is None:
+        print("No display and xvfb-run not found; skipping time to first frame")
+    else:
+        frame_times = [measure_first_frame_ms(command) for _ in range(args.runs)]
+        results["first_frame_ms"] = statistics.median(frame_times)
+
+    print(json.dumps(results, indent=2))
+
+    failed = results["import_ms"] > args.max_import_ms or (
+        results.get("first_frame_ms", 0.0) > args.max_frame_ms
+    )
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
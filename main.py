@@ -5,41 +5,1063 @@ A modern GUI application for downloading multiple YouTube videos or audio files.
 
 import os
 import re
+import json
+import time
 import threading
+import functools
 import shutil
-from typing import Callable, Optional
-from dataclasses import dataclass
+import subprocess
+from enum import IntEnum
+from collections import deque
+from typing import Callable, Iterator, Optional
+from dataclasses import dataclass, field
 import customtkinter as ctk
-import yt_dlp
 
+# yt-dlp takes a noticeable share of startup time to import, so it is loaded
+# on first use (or preloaded in the background) via load_yt_dlp()
+_yt_dlp = None
+_yt_dlp_lock = threading.Lock()
 
-@dataclass
+
+def load_yt_dlp():
+    """
+    Import yt-dlp on first use.
+    
+    Returns:
+        The yt_dlp module
+    """
+    global _yt_dlp
+    with _yt_dlp_lock:
+        if _yt_dlp is None:
+            import yt_dlp
+            _yt_dlp = yt_dlp
+        return _yt_dlp
+
+
+def preload_yt_dlp() -> None:
+    """Import yt-dlp in a background thread so the first download doesn't wait."""
+    threading.Thread(target=load_yt_dlp, daemon=True).start()
+
+
+class JobStatus(IntEnum):
+    """Lifecycle state of a download job."""
+    QUEUED = 0
+    STARTING = 1
+    DOWNLOADING = 2
+    PROCESSING = 3
+    DONE = 4
+    FAILED = 5
+    PAUSED = 6
+    CANCELLED = 7
+    
+    @property
+    def label(self) -> str:
+        """Display name, e.g. "Downloading"."""
+        return self.name.capitalize()
+
+
+class ErrorCode(IntEnum):
+    """Why a download failed, stored instead of the full error message."""
+    NONE = 0
+    UNKNOWN = 1
+    UNAVAILABLE = 2
+    PRIVATE = 3
+    AGE_RESTRICTED = 4
+    GEO_BLOCKED = 5
+    NETWORK = 6
+    FFMPEG = 7
+    
+    @property
+    def label(self) -> str:
+        """Display name, e.g. "Geo blocked"."""
+        return self.name.replace('_', ' ').capitalize()
+
+
+# Substrings of yt-dlp error messages, checked in order
+ERROR_PATTERNS = (
+    ("private video", ErrorCode.PRIVATE),
+    ("confirm your age", ErrorCode.AGE_RESTRICTED),
+    ("age-restricted", ErrorCode.AGE_RESTRICTED),
+    ("not available in your country", ErrorCode.GEO_BLOCKED),
+    ("geo restrict", ErrorCode.GEO_BLOCKED),
+    ("unavailable", ErrorCode.UNAVAILABLE),
+    ("ffmpeg", ErrorCode.FFMPEG),
+    ("postprocessing", ErrorCode.FFMPEG),
+    ("http error", ErrorCode.NETWORK),
+    ("timed out", ErrorCode.NETWORK),
+    ("connection", ErrorCode.NETWORK),
+    ("unable to download", ErrorCode.NETWORK),
+)
+
+
+def classify_error(error: BaseException) -> ErrorCode:
+    """
+    Map a download exception to an error code.
+    
+    Args:
+        error: Exception raised by yt-dlp
+        
+    Returns:
+        The matching ErrorCode, or ErrorCode.UNKNOWN
+    """
+    text = str(error).lower()
+    for pattern, code in ERROR_PATTERNS:
+        if pattern in text:
+            return code
+    return ErrorCode.UNKNOWN
+
+
+@dataclass(slots=True)
 class DownloadResult:
     """Result of a single download operation."""
     url: str
-    success: bool
-    message: str
+    status: JobStatus
+    error: ErrorCode = ErrorCode.NONE
     filename: Optional[str] = None
+    
+    @property
+    def success(self) -> bool:
+        """True if the download finished."""
+        return self.status == JobStatus.DONE
+    
+    @property
+    def message(self) -> str:
+        """Human readable summary, built on demand."""
+        if self.success:
+            return f"Successfully downloaded: {self.filename}"
+        if self.status == JobStatus.CANCELLED:
+            return f"Cancelled: {self.url}"
+        return f"Failed to download {self.url}: {self.error.label}"
+
+
+class ResultLog:
+    """
+    Download results with running success, failure and cancellation counters.
+    
+    With a spill_path, results are appended to a JSONL file instead of being
+    kept in memory, and iteration reads them back from that file.
+    """
+    
+    def __init__(self, spill_path: Optional[str] = None) -> None:
+        """
+        Initialize an empty result log.
+        
+        Args:
+            spill_path: Optional JSONL file to write results to
+        """
+        self.spill_path = spill_path
+        self.succeeded = 0
+        self.failed = 0
+        self.cancelled = 0
+        self._results: list[DownloadResult] = []
+        self._spill_file = open(spill_path, "w", encoding="utf-8") if spill_path else None
+    
+    def __len__(self) -> int:
+        return self.succeeded + self.failed + self.cancelled
+    
+    def __iter__(self) -> Iterator[DownloadResult]:
+        if self.spill_path is None:
+            yield from self._results
+            return
+        
+        if self._spill_file is not None:
+            self._spill_file.flush()
+        with open(self.spill_path, encoding="utf-8") as f:
+            for line in f:
+                record = json.loads(line)
+                yield DownloadResult(
+                    url=record["url"],
+                    status=JobStatus(record["status"]),
+                    error=ErrorCode(record["error"]),
+                    filename=record["filename"],
+                )
+    
+    def append(self, result: DownloadResult) -> None:
+        """
+        Record a result and update the counters.
+        
+        Args:
+            result: Result to record
+        """
+        if result.success:
+            self.succeeded += 1
+        elif result.status == JobStatus.CANCELLED:
+            self.cancelled += 1
+        else:
+            self.failed += 1
+        
+        if self.spill_path is None:
+            self._results.append(result)
+        else:
+            self._spill_file.write(json.dumps({
+                "url": result.url,
+                "status": int(result.status),
+                "error": int(result.error),
+                "filename": result.filename,
+            }) + "\n")
+    
+    def extend_cancelled(self, urls: list[str]) -> None:
+        """
+        Record many cancelled jobs at once, e.g. a whole cancelled queue.
+        
+        Args:
+            urls: URLs of the cancelled jobs
+        """
+        self.cancelled += len(urls)
+        if self.spill_path is None:
+            self._results.extend(DownloadResult(url, JobStatus.CANCELLED) for url in urls)
+        else:
+            # Only the URL differs between lines, so encode the rest once
+            rest = json.dumps({
+                "status": int(JobStatus.CANCELLED),
+                "error": int(ErrorCode.NONE),
+                "filename": None,
+            })[1:]
+            self._spill_file.write("".join(
+                f'{{"url": {json.dumps(url)}, {rest}\n' for url in urls
+            ))
+    
+    def failed_urls(self, limit: int) -> list[str]:
+        """
+        Get the first failed URLs.
+        
+        Args:
+            limit: Maximum number of URLs to return
+            
+        Returns:
+            Up to limit failed URLs, in download order
+        """
+        urls = []
+        if self.failed:
+            for result in self:
+                if result.status == JobStatus.FAILED:
+                    urls.append(result.url)
+                    if len(urls) == limit:
+                        break
+        return urls
+    
+    def close(self) -> None:
+        """Flush and close the spill file, if any."""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+
+@dataclass(slots=True)
+class JobRow:
+    """Display state of a single queued download job."""
+    url: str
+    status: JobStatus = JobStatus.QUEUED
+    title: str = ""
+    percent: float = 0.0
+    speed: Optional[float] = None
+    eta: Optional[int] = None
+    error: ErrorCode = ErrorCode.NONE
+    
+    @property
+    def status_text(self) -> str:
+        """Text for the Status column, e.g. "42%" or "Failed: Private"."""
+        if self.status == JobStatus.DOWNLOADING:
+            return f"{self.percent:.0%}"
+        if self.status == JobStatus.FAILED and self.error != ErrorCode.NONE:
+            return f"{self.status.label}: {self.error.label}"
+        return self.status.label
+
+
+def format_speed(speed: Optional[float]) -> str:
+    """
+    Format a transfer speed for display.
+    
+    Args:
+        speed: Speed in bytes per second, or None if unknown
+        
+    Returns:
+        Human readable speed such as "1.5 MiB/s"
+    """
+    if not speed:
+        return "-"
+    for unit in ("B/s", "KiB/s", "MiB/s"):
+        if speed < 1024:
+            return f"{speed:.1f} {unit}"
+        speed /= 1024
+    return f"{speed:.1f} GiB/s"
+
+
+def format_eta(eta: Optional[int]) -> str:
+    """
+    Format a remaining time estimate for display.
+    
+    Args:
+        eta: Remaining seconds, or None if unknown
+        
+    Returns:
+        Time formatted as "m:ss" or "h:mm:ss"
+    """
+    if eta is None:
+        return "-"
+    minutes, seconds = divmod(int(eta), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+
+class JobModel:
+    """
+    Thread-safe table of job rows with batched change tracking.
+    
+    Worker threads call update() as often as they like; the GUI drains the
+    accumulated changes once per frame and only repaints the rows that changed.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize an empty job model."""
+        self._rows: list[JobRow] = []
+        self._dirty: set[int] = set()
+        self._reset = False
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def reset(self, urls: list[str]) -> None:
+        """
+        Replace all rows with a fresh queue.
+        
+        Args:
+            urls: URLs of the new jobs, in queue order
+        """
+        with self._lock:
+            self._rows = [JobRow(url) for url in urls]
+            self._dirty.clear()
+            self._reset = True
+    
+    def extend(self, urls: list[str]) -> None:
+        """
+        Append rows for jobs added to a running queue.
+        
+        Args:
+            urls: URLs of the new jobs, in queue order
+        """
+        with self._lock:
+            start = len(self._rows)
+            self._rows.extend(JobRow(url) for url in urls)
+            self._dirty.update(range(start, len(self._rows)))
+    
+    def truncate(self, length: int) -> None:
+        """
+        Drop rows past length, e.g. ones the engine refused to queue.
+        
+        Args:
+            length: Number of rows to keep
+        """
+        with self._lock:
+            if length < len(self._rows):
+                del self._rows[length:]
+                self._dirty = {index for index in self._dirty if index < length}
+                self._reset = True
+    
+    def update(self, index: int, **fields) -> None:
+        """
+        Update fields of a single row and mark it as changed.
+        
+        Args:
+            index: Zero-based job index
+            **fields: JobRow attributes to overwrite
+        """
+        with self._lock:
+            row = self._rows[index]
+            for name, value in fields.items():
+                setattr(row, name, value)
+            self._dirty.add(index)
+    
+    def update_many(self, indices: list[int], **fields) -> None:
+        """
+        Set the same fields on many rows under a single lock.
+        
+        Args:
+            indices: Zero-based job indices
+            **fields: JobRow attributes to overwrite
+        """
+        with self._lock:
+            rows = self._rows
+            for index in indices:
+                row = rows[index]
+                for name, value in fields.items():
+                    setattr(row, name, value)
+            self._dirty.update(indices)
+    
+    def update_fields(self, index: int, fields: dict) -> None:
+        """
+        Update a row from a dict, matching DownloaderEngine's job_callback.
+        
+        Args:
+            index: Zero-based job index
+            fields: JobRow attributes to overwrite
+        """
+        self.update(index, **fields)
+    
+    def row(self, index: int) -> JobRow:
+        """
+        Get a single row.
+        
+        Args:
+            index: Zero-based job index
+            
+        Returns:
+            The JobRow at that index
+        """
+        return self._rows[index]
+    
+    def drain(self) -> tuple[bool, set[int]]:
+        """
+        Collect the changes accumulated since the previous drain.
+        
+        Returns:
+            Tuple of (was_reset, changed_indices)
+        """
+        with self._lock:
+            reset, dirty = self._reset, self._dirty
+            self._reset = False
+            self._dirty = set()
+        return reset, dirty
+
+
+# Audio encoders in order of preference, mapped to yt-dlp's preferredcodec
+AUDIO_ENCODERS = (("libmp3lame", "mp3"), ("aac", "m4a"))
+
+HARDWARE_ENCODER_SUFFIXES = ("_nvenc", "_qsv", "_amf", "_vaapi", "_videotoolbox", "_v4l2m2m")
+
+
+@dataclass(frozen=True)
+class FFmpegCapabilities:
+    """What the installed FFmpeg binary can do, as found by probe_ffmpeg()."""
+    path: Optional[str] = None
+    version: str = ""
+    encoders: frozenset[str] = field(default_factory=frozenset)
+    muxers: frozenset[str] = field(default_factory=frozenset)
+    
+    @property
+    def available(self) -> bool:
+        """True if an FFmpeg binary was found."""
+        return self.path is not None
+    
+    @property
+    def hardware_encoders(self) -> tuple[str, ...]:
+        """Hardware accelerated encoders, sorted by name."""
+        return tuple(sorted(
+            name for name in self.encoders if name.endswith(HARDWARE_ENCODER_SUFFIXES)
+        ))
+    
+    @property
+    def audio_codec(self) -> Optional[str]:
+        """Preferred yt-dlp audio codec this build can encode, or None."""
+        if not self.encoders:
+            # Probe output unavailable; assume a standard build
+            return "mp3" if self.available else None
+        for encoder, codec in AUDIO_ENCODERS:
+            if encoder in self.encoders:
+                return codec
+        return None
+
+
+def _run_ffmpeg(path: str, *args: str) -> str:
+    """
+    Run FFmpeg and return its standard output.
+    
+    Args:
+        path: Path to the FFmpeg binary
+        *args: Command line arguments
+        
+    Returns:
+        Captured stdout, or an empty string if FFmpeg could not be run
+    """
+    try:
+        completed = subprocess.run(
+            [path, "-hide_banner", *args],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    return completed.stdout
+
+
+def _parse_ffmpeg_table(output: str) -> frozenset[str]:
+    """
+    Parse the name column of `ffmpeg -encoders` or `ffmpeg -muxers` output.
+    
+    Args:
+        output: Raw command output
+        
+    Returns:
+        Set of encoder or muxer names
+    """
+    names = set()
+    in_table = False
+    for line in output.splitlines():
+        parts = line.split()
+        if not in_table:
+            # The listing starts after a "------" or "--" separator line
+            in_table = bool(parts) and set(parts[0]) == {"-"}
+            continue
+        if len(parts) >= 2:
+            names.update(parts[1].split(","))
+    return frozenset(names)
+
+
+def probe_ffmpeg(cache_file: Optional[str] = None) -> FFmpegCapabilities:
+    """
+    Probe the FFmpeg binary on PATH for its version, encoders and muxers.
+    
+    Results are cached in cache_file keyed by binary path and mtime, so the
+    subprocesses only run again after FFmpeg is moved or upgraded.
+    
+    Args:
+        cache_file: Optional JSON file used to persist the probe result
+        
+    Returns:
+        FFmpegCapabilities for the binary (empty if FFmpeg is not installed)
+    """
+    path = shutil.which("ffmpeg")
+    if path is None:
+        return FFmpegCapabilities()
+    
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        mtime = None
+    
+    if cache_file and mtime is not None:
+        try:
+            with open(cache_file, encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("path") == path and cached.get("mtime") == mtime:
+                return FFmpegCapabilities(
+                    path=path,
+                    version=cached["version"],
+                    encoders=frozenset(cached["encoders"]),
+                    muxers=frozenset(cached["muxers"]),
+                )
+        except (OSError, ValueError, KeyError):
+            pass
+    
+    version_output = _run_ffmpeg(path, "-version").split()
+    capabilities = FFmpegCapabilities(
+        path=path,
+        version=version_output[2] if len(version_output) > 2 else "",
+        encoders=_parse_ffmpeg_table(_run_ffmpeg(path, "-encoders")),
+        muxers=_parse_ffmpeg_table(_run_ffmpeg(path, "-muxers")),
+    )
+    
+    if cache_file and mtime is not None:
+        try:
+            with open(cache_file, "w", encoding="utf-8") as f:
+                json.dump({
+                    "path": path,
+                    "mtime": mtime,
+                    "version": capabilities.version,
+                    "encoders": sorted(capabilities.encoders),
+                    "muxers": sorted(capabilities.muxers),
+                }, f)
+        except OSError:
+            pass
+    
+    return capabilities
+
+
+class UrlValidator:
+    """Validates pasted URLs off the main thread, caching per-line results."""
+    
+    def __init__(self, is_valid: Callable[[str], bool]) -> None:
+        """
+        Initialize the validator.
+        
+        Args:
+            is_valid: Predicate deciding whether a single URL is valid
+        """
+        self.is_valid = is_valid
+        self._cache: dict[str, bool] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+    
+    def classify(self, urls: list[str]) -> tuple[list[str], list[str]]:
+        """
+        Partition URLs into valid and invalid, reusing cached results.
+        
+        Args:
+            urls: List of URLs to validate
+            
+        Returns:
+            Tuple of (valid_urls, invalid_urls)
+        """
+        valid_urls = []
+        invalid_urls = []
+        cache = self._cache
+        
+        for url in urls:
+            url = url.strip()
+            if not url:
+                continue
+            ok = cache.get(url)
+            if ok is None:
+                ok = cache[url] = self.is_valid(url)
+            (valid_urls if ok else invalid_urls).append(url)
+        
+        return valid_urls, invalid_urls
+    
+    def submit(
+        self,
+        text: str,
+        callback: Callable[[list[str], list[str]], None]
+    ) -> None:
+        """
+        Validate text in a background thread.
+        
+        The callback only fires for the most recent submission, so results for
+        text the user has since edited are dropped.
+        
+        Args:
+            text: Raw textbox contents, one URL per line
+            callback: Called with (valid_urls, invalid_urls) from the worker thread
+        """
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+        
+        def worker() -> None:
+            result = self.classify(text.split('\n'))
+            if generation == self._generation:
+                callback(*result)
+        
+        threading.Thread(target=worker, daemon=True).start()
+
+
+class Priority(IntEnum):
+    """Scheduling lane of a job; lower values are more urgent."""
+    URGENT = 0
+    NORMAL = 1
+    BULK = 2
+    
+    @property
+    def label(self) -> str:
+        """Display name, e.g. "Urgent"."""
+        return self.name.capitalize()
+
+
+# Share of worker slots each lane gets while several lanes have work queued
+LANE_WEIGHTS = {Priority.URGENT: 8, Priority.NORMAL: 3, Priority.BULK: 1}
+
+# Wait time (seconds before a job starts) each lane should stay under at p95
+LANE_WAIT_TARGETS = {Priority.URGENT: 5.0, Priority.NORMAL: 60.0}
+
+# Number of recent wait times kept per lane for percentile reporting
+LANE_WAIT_SAMPLES = 1000
+
+
+@dataclass(slots=True, eq=False)
+class Job:
+    """A queued download job (compared by identity)."""
+    index: int
+    url: str
+    priority: Priority
+    enqueued_at: float = 0.0
+    started: bool = False
+    preemptible: bool = True
+    preemptions: int = 0
+    paused: bool = False
+    cancelled: bool = False
+    held: bool = False
+
+
+@dataclass(slots=True)
+class LaneStats:
+    """Wait-time summary of one scheduling lane."""
+    priority: Priority
+    started: int = 0
+    mean_wait: float = 0.0
+    p95_wait: float = 0.0
+    max_wait: float = 0.0
+    
+    @property
+    def target(self) -> Optional[float]:
+        """Target p95 wait in seconds, or None if the lane has no target."""
+        return LANE_WAIT_TARGETS.get(self.priority)
+    
+    @property
+    def met_target(self) -> bool:
+        """True if the p95 wait is within the lane's target."""
+        return self.target is None or self.p95_wait <= self.target
+    
+    def __str__(self) -> str:
+        text = (
+            f"{self.priority.label}: {self.started} started, "
+            f"wait mean {self.mean_wait:.1f}s / p95 {self.p95_wait:.1f}s / max {self.max_wait:.1f}s"
+        )
+        if self.target is not None:
+            text += f" (target {self.target:.0f}s{'' if self.met_target else ', MISSED'})"
+        return text
+
+
+class JobInterrupted(Exception):
+    """Raised from a yt-dlp hook to stop a running job, keeping its .part file."""
+    
+    def __init__(self, job: Job) -> None:
+        super().__init__(f"{type(self).__name__}: {job.url}")
+        self.job = job
+
+
+class JobPreempted(JobInterrupted):
+    """The job yields its slot so a more urgent one can run."""
+
+
+class JobPaused(JobInterrupted):
+    """The job, or the whole batch, was paused."""
+
+
+class JobCancelled(JobInterrupted):
+    """The job, or the whole batch, was cancelled."""
+
+
+class LaneScheduler:
+    """
+    Priority lanes with weighted-fair dispatch to a pool of workers.
+    
+    Lanes are served by smooth weighted round robin over LANE_WEIGHTS, so a
+    large bulk batch can't starve urgent jobs and urgent jobs can't fully
+    starve bulk ones. A worker running a lower-priority job can claim a
+    preemption when a more urgent job is waiting; it then requeues its job at
+    the front of its lane and the next dispatch goes to the most urgent lane.
+    
+    Jobs paused individually are held outside the lanes until released.
+    Pausing the scheduler stops dispatch; cancelling it empties the lanes.
+    
+    get() returns None once every lane is empty and no job is in flight or
+    held, after which the scheduler is closed and rejects new jobs.
+    """
+    
+    def __init__(self, weights: Optional[dict[Priority, int]] = None) -> None:
+        """
+        Initialize an empty scheduler.
+        
+        Args:
+            weights: Optional lane weights, defaulting to LANE_WEIGHTS
+        """
+        self.weights = weights or LANE_WEIGHTS
+        self._lanes: dict[Priority, deque[Job]] = {p: deque() for p in Priority}
+        self._credits: dict[Priority, int] = {p: 0 for p in Priority}
+        self._waits: dict[Priority, deque[float]] = {
+            p: deque(maxlen=LANE_WAIT_SAMPLES) for p in Priority
+        }
+        self._wait_totals: dict[Priority, list] = {p: [0, 0.0, 0.0] for p in Priority}
+        self._in_flight = 0
+        self._preempting = 0
+        self._held: dict[int, Job] = {}
+        self.closed = False
+        self.paused = False
+        self.cancelled = False
+        self._condition = threading.Condition()
+    
+    def __len__(self) -> int:
+        """Number of queued jobs across all lanes."""
+        return sum(len(lane) for lane in self._lanes.values())
+    
+    def put(self, *jobs: Job) -> bool:
+        """
+        Queue new jobs at the back of their lanes, all or none.
+        
+        Args:
+            *jobs: Jobs to queue
+            
+        Returns:
+            False if the scheduler has already closed
+        """
+        with self._condition:
+            if self.closed or self.cancelled:
+                return False
+            now = time.monotonic()
+            for job in jobs:
+                job.enqueued_at = now
+                self._lanes[job.priority].append(job)
+            self._condition.notify_all()
+            return True
+    
+    def get(self) -> Optional[Job]:
+        """
+        Wait for the next job to run.
+        
+        Returns:
+            The dispatched Job, or None once all work is finished
+        """
+        with self._condition:
+            while self.paused or not len(self):
+                if not len(self) and self._in_flight == 0 and not self._held:
+                    self.closed = True
+                    self._condition.notify_all()
+                    return None
+                self._condition.wait()
+            
+            if self._preempting:
+                # A worker paused its job for this; serve the most urgent lane
+                self._preempting -= 1
+                priority = min(p for p, lane in self._lanes.items() if lane)
+            else:
+                priority = self._pick_lane()
+            
+            job = self._lanes[priority].popleft()
+            self._in_flight += 1
+            
+            # A job picked by fair share while more urgent work waits keeps its slot
+            job.preemptible = not any(
+                self._lanes[p] for p in Priority if p < job.priority
+            )
+            
+            if not job.started:
+                job.started = True
+                self._record_wait(priority, time.monotonic() - job.enqueued_at)
+            return job
+    
+    def _pick_lane(self) -> Priority:
+        """Choose a non-empty lane by smooth weighted round robin."""
+        active = [p for p, lane in self._lanes.items() if lane]
+        for priority in active:
+            self._credits[priority] += self.weights[priority]
+        chosen = max(active, key=lambda p: (self._credits[p], -p))
+        self._credits[chosen] -= sum(self.weights[p] for p in active)
+        return chosen
+    
+    def _record_wait(self, priority: Priority, wait: float) -> None:
+        """Add a start latency sample to a lane's statistics."""
+        self._waits[priority].append(wait)
+        totals = self._wait_totals[priority]
+        totals[0] += 1
+        totals[1] += wait
+        totals[2] = max(totals[2], wait)
+    
+    def task_done(self, job: Job, requeue: bool = False) -> None:
+        """
+        Release the worker slot held by a job.
+        
+        Args:
+            job: Job that stopped running
+            requeue: Put the job back at the front of its lane to resume later
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if requeue:
+                job.preemptions += 1
+                self._lanes[job.priority].appendleft(job)
+            self._condition.notify_all()
+    
+    def hold(self, job: Job) -> None:
+        """
+        Release the slot of a job paused on its own and keep it out of the lanes.
+        
+        If the job was resumed in the meantime it is requeued instead.
+        
+        Args:
+            job: Job that stopped running
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if job.paused:
+                job.held = True
+                self._held[job.index] = job
+            else:
+                self._lanes[job.priority].appendleft(job)
+            self._condition.notify_all()
+    
+    def release(self, job: Job, requeue: bool = True) -> bool:
+        """
+        Release a held job, either back to the front of its lane or for good.
+        
+        Args:
+            job: Job previously passed to hold()
+            requeue: False to drop the job instead of resuming it
+            
+        Returns:
+            False if the job was not held
+        """
+        with self._condition:
+            if not job.held:
+                return False
+            job.held = False
+            del self._held[job.index]
+            if requeue:
+                if not job.started:
+                    # Time spent paused by the user doesn't count as waiting
+                    job.enqueued_at = time.monotonic()
+                self._lanes[job.priority].appendleft(job)
+            self._condition.notify_all()
+            return True
+    
+    def withdraw(self, job: Job) -> bool:
+        """
+        Take a queued job out of its lane, holding it if it is paused.
+        
+        Args:
+            job: Job to withdraw
+            
+        Returns:
+            False if the job was not queued (running, held or finished)
+        """
+        with self._condition:
+            try:
+                self._lanes[job.priority].remove(job)
+            except ValueError:
+                return False
+            if job.paused:
+                job.held = True
+                self._held[job.index] = job
+            self._condition.notify_all()
+            return True
+    
+    def pause(self) -> None:
+        """Stop dispatching jobs until resume() is called."""
+        with self._condition:
+            self.paused = True
+    
+    def resume(self) -> None:
+        """Resume dispatching jobs."""
+        with self._condition:
+            self.paused = False
+            self._condition.notify_all()
+    
+    def cancel(self) -> list[Job]:
+        """
+        Cancel everything that is not running yet.
+        
+        Returns:
+            The queued and held jobs that were removed
+        """
+        with self._condition:
+            self.cancelled = True
+            self.paused = False
+            removed = [job for lane in self._lanes.values() for job in lane]
+            removed.extend(self._held.values())
+            for lane in self._lanes.values():
+                lane.clear()
+            self._held.clear()
+            for job in removed:
+                job.held = False
+            self._condition.notify_all()
+            return removed
+    
+    def claim_preemption(self, priority: Priority) -> bool:
+        """
+        Check whether a job of the given priority should yield its slot.
+        
+        Each waiting job of higher priority can be claimed by one running job,
+        so a single urgent job pauses a single bulk download.
+        
+        Args:
+            priority: Priority of the running job
+            
+        Returns:
+            True if the caller should pause its job
+        """
+        with self._condition:
+            waiting = sum(len(self._lanes[p]) for p in Priority if p < priority)
+            if waiting > self._preempting:
+                self._preempting += 1
+                return True
+            return False
+    
+    def lane_stats(self) -> list[LaneStats]:
+        """
+        Summarize start latency for each lane that has started jobs.
+        
+        Returns:
+            LaneStats per lane, most urgent first
+        """
+        stats = []
+        with self._condition:
+            for priority in Priority:
+                count, total, longest = self._wait_totals[priority]
+                if not count:
+                    continue
+                samples = sorted(self._waits[priority])
+                stats.append(LaneStats(
+                    priority=priority,
+                    started=count,
+                    mean_wait=total / count,
+                    p95_wait=samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+                    max_wait=longest,
+                ))
+        return stats
 
 
 class DownloaderEngine:
     """Handles YouTube download operations using yt-dlp."""
     
-    def __init__(self, download_dir: str) -> None:
+    YOUTUBE_PATTERN = re.compile(
+        r'(https?://)?(www\.)?(youtube\.com/(watch\?v=|shorts/)|youtu\.be/)[a-zA-Z0-9_-]+'
+    )
+    
+    def __init__(
+        self,
+        download_dir: str,
+        capability_cache: Optional[str] = None,
+        max_workers: int = 1
+    ) -> None:
         """
         Initialize the downloader engine.
         
         Args:
             download_dir: Directory where downloads will be saved
+            capability_cache: Optional file for caching the FFmpeg probe on disk
+            max_workers: Number of downloads allowed to run at the same time
         """
         self.download_dir = download_dir
-        self.current_index = 0
+        self.capability_cache = capability_cache
+        self.max_workers = max_workers
+        self.capabilities: Optional[FFmpegCapabilities] = None
+        self._probe_lock = threading.Lock()
+        self._opts_cache: dict[tuple, dict] = {}
+        self.scheduler: Optional[LaneScheduler] = None
+        self.jobs: list[Job] = []
+        self._batch_urls: set[str] = set()
+        self.results: Optional[ResultLog] = None
+        self._jobs_lock = threading.Lock()
+        self.completed = 0
         self.total_urls = 0
         self.progress_callback: Optional[Callable[[int, int, str], None]] = None
-        
-        # Create downloads directory if it doesn't exist
+        self.job_callback: Optional[Callable[[int, dict], None]] = None
+    
+    def ensure_download_dir(self) -> None:
+        """Create the downloads directory if it doesn't exist."""
         os.makedirs(self.download_dir, exist_ok=True)
     
+    def get_capabilities(self) -> FFmpegCapabilities:
+        """
+        Get the FFmpeg capability profile, probing on first use.
+        
+        Returns:
+            FFmpegCapabilities for the FFmpeg binary on PATH
+        """
+        with self._probe_lock:
+            if self.capabilities is None:
+                self.capabilities = probe_ffmpeg(self.capability_cache)
+            return self.capabilities
+    
+    def start_capability_probe(
+        self,
+        callback: Optional[Callable[[FFmpegCapabilities], None]] = None
+    ) -> None:
+        """
+        Probe FFmpeg in a background thread.
+        
+        Args:
+            callback: Optional function called from the worker thread with the result
+        """
+        def worker() -> None:
+            capabilities = self.get_capabilities()
+            if callback:
+                callback(capabilities)
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
     def check_ffmpeg(self) -> bool:
         """
         Check if FFmpeg is available in the system PATH.
@@ -47,7 +1069,19 @@ class DownloaderEngine:
         Returns:
             True if FFmpeg is available, False otherwise
         """
-        return shutil.which("ffmpeg") is not None
+        return self.get_capabilities().available
+    
+    def is_valid_url(self, url: str) -> bool:
+        """
+        Check whether a single stripped URL is a YouTube URL.
+        
+        Args:
+            url: URL to check
+            
+        Returns:
+            True if the URL is a YouTube video or short URL
+        """
+        return self.YOUTUBE_PATTERN.match(url) is not None
     
     def validate_urls(self, urls: list[str]) -> tuple[list[str], list[str]]:
         """
@@ -59,10 +1093,6 @@ class DownloaderEngine:
         Returns:
             Tuple of (valid_urls, invalid_urls)
         """
-        youtube_pattern = re.compile(
-            r'(https?://)?(www\.)?(youtube\.com/(watch\?v=|shorts/)|youtu\.be/)[a-zA-Z0-9_-]+'
-        )
-        
         valid_urls = []
         invalid_urls = []
         
@@ -70,7 +1100,7 @@ class DownloaderEngine:
             url = url.strip()
             if not url:
                 continue
-            if youtube_pattern.match(url):
+            if self.is_valid_url(url):
                 valid_urls.append(url)
             else:
                 invalid_urls.append(url)
@@ -104,39 +1134,68 @@ class DownloaderEngine:
         
         return sanitized
     
-    def get_ydl_opts(self, format_type: str, quality: str) -> dict:
+    def get_ydl_opts(self, format_type: str, quality: str) -> dict:
+        """
+        Build yt-dlp options based on format and quality selection.
+        
+        Options are memoized per (format, quality, FFmpeg capabilities).
+        
+        Args:
+            format_type: "video" or "audio"
+            quality: "best", "1080p", "720p", or "480p"
+            
+        Returns:
+            Dictionary of yt-dlp options
+        """
+        capabilities = self.get_capabilities()
+        key = (format_type, quality, capabilities)
+        opts = self._opts_cache.get(key)
+        if opts is None:
+            opts = self._opts_cache[key] = self._build_ydl_opts(
+                format_type, quality, capabilities
+            )
+        # Shallow copy so callers can't alter the cached entry's top level
+        return dict(opts)
+    
+    def _build_ydl_opts(
+        self,
+        format_type: str,
+        quality: str,
+        capabilities: FFmpegCapabilities
+    ) -> dict:
         """
-        Build yt-dlp options based on format and quality selection.
+        Build yt-dlp options from an FFmpeg capability profile.
         
         Args:
             format_type: "video" or "audio"
             quality: "best", "1080p", "720p", or "480p"
+            capabilities: Probed FFmpeg capabilities
             
         Returns:
             Dictionary of yt-dlp options
         """
         base_opts = {
             'outtmpl': os.path.join(self.download_dir, '%(title)s.%(ext)s'),
-            'progress_hooks': [self.progress_hook],
             'quiet': False,
             'no_warnings': False,
         }
         
-        # Check if FFmpeg is available
-        has_ffmpeg = self.check_ffmpeg()
+        has_ffmpeg = capabilities.available
         
         if format_type == "audio":
-            if has_ffmpeg:
+            # Builds without the MP3 encoder fall back to the next codec they can encode
+            audio_codec = capabilities.audio_codec if has_ffmpeg else None
+            if audio_codec:
                 base_opts.update({
                     'format': 'bestaudio/best',
                     'postprocessors': [{
                         'key': 'FFmpegExtractAudio',
-                        'preferredcodec': 'mp3',
+                        'preferredcodec': audio_codec,
                         'preferredquality': '192',
                     }],
                 })
             else:
-                # Without FFmpeg, download best audio format available
+                # Without a usable encoder, download best audio format available
                 base_opts.update({
                     'format': 'bestaudio/best',
                 })
@@ -159,97 +1218,685 @@ class DownloaderEngine:
         
         return base_opts
     
-    def progress_hook(self, d: dict) -> None:
+    def check_interrupt(self, job: Job) -> None:
+        """
+        Stop a running job if it or its batch was cancelled or paused.
+        
+        Called from the yt-dlp hooks, i.e. after every block of data and at
+        the start of each postprocessing stage, so a request takes effect
+        within one block read (about a second at the current rate, or the
+        socket timeout on a stalled connection).
+        
+        Args:
+            job: Job being downloaded
+            
+        Raises:
+            JobCancelled: If the job or the batch was cancelled
+            JobPaused: If the job or the batch was paused
+        """
+        scheduler = self.scheduler
+        if job.cancelled or (scheduler is not None and scheduler.cancelled):
+            raise JobCancelled(job)
+        if job.paused or (scheduler is not None and scheduler.paused):
+            raise JobPaused(job)
+    
+    def progress_hook(self, d: dict, job: Job) -> None:
         """
         Progress hook called by yt-dlp during download.
         
         Args:
             d: Progress dictionary from yt-dlp
+            job: Job being downloaded
+            
+        Raises:
+            JobInterrupted: If the job has to stop; its .part file lets
+                yt-dlp resume from this point later
         """
-        if d['status'] == 'downloading' and self.progress_callback:
-            # Extract progress information
-            if 'filename' in d:
-                filename = os.path.basename(d['filename'])
-                title = filename
-            else:
-                title = "Unknown"
+        self.check_interrupt(job)
+        
+        if 'filename' in d:
+            title = os.path.basename(d['filename'])
+        else:
+            title = "Unknown"
+        
+        if d['status'] == 'downloading':
+            if (job.preemptible and self.scheduler is not None
+                    and self.scheduler.claim_preemption(job.priority)):
+                raise JobPreempted(job)
+            
+            if self.progress_callback:
+                self.progress_callback(self.completed + 1, self.total_urls, title)
+            
+            if self.job_callback:
+                total = d.get('total_bytes') or d.get('total_bytes_estimate')
+                downloaded = d.get('downloaded_bytes') or 0
+                self.job_callback(job.index, {
+                    'status': JobStatus.DOWNLOADING,
+                    'title': title,
+                    'percent': downloaded / total if total else 0.0,
+                    'speed': d.get('speed'),
+                    'eta': d.get('eta'),
+                })
+        elif d['status'] == 'finished' and self.job_callback:
+            self.job_callback(job.index, {
+                'status': JobStatus.PROCESSING,
+                'percent': 1.0,
+                'speed': None,
+                'eta': None,
+            })
+    
+    def postprocessor_hook(self, d: dict, job: Job) -> None:
+        """
+        Postprocessor hook called by yt-dlp around each postprocessing stage.
+        
+        Args:
+            d: Postprocessor status dictionary from yt-dlp
+            job: Job being processed
+            
+        Raises:
+            JobInterrupted: If the job has to stop before the next stage
+        """
+        if d['status'] == 'started':
+            self.check_interrupt(job)
+    
+    def is_running(self) -> bool:
+        """True while the current batch can still take jobs and controls."""
+        scheduler = self.scheduler
+        return scheduler is not None and not scheduler.closed and not scheduler.cancelled
+    
+    def is_paused(self) -> bool:
+        """True if the current batch is paused."""
+        return self.is_running() and self.scheduler.paused
+    
+    def _job(self, index: int) -> Optional[Job]:
+        """Get a job of the running batch, or None if there is no such job."""
+        with self._jobs_lock:
+            if self.is_running() and 0 <= index < len(self.jobs):
+                return self.jobs[index]
+        return None
+    
+    def pause_job(self, index: int) -> bool:
+        """
+        Pause one job; a running job stops at its next hook and keeps its .part file.
+        
+        Args:
+            index: Zero-based job index
+            
+        Returns:
+            False if the running batch has no such job
+        """
+        job = self._job(index)
+        if job is None:
+            return False
+        job.paused = True
+        if self.scheduler.withdraw(job):
+            self._report(job, {'status': JobStatus.PAUSED})
+        return True
+    
+    def resume_job(self, index: int) -> bool:
+        """
+        Resume a paused job at the front of its lane.
+        
+        Args:
+            index: Zero-based job index
+            
+        Returns:
+            False if the running batch has no such job
+        """
+        job = self._job(index)
+        if job is None:
+            return False
+        job.paused = False
+        if self.scheduler.release(job):
+            self._report(job, {'status': JobStatus.QUEUED})
+        return True
+    
+    def cancel_job(self, index: int) -> bool:
+        """
+        Cancel one job; a running job stops at its next hook.
+        
+        Args:
+            index: Zero-based job index
+            
+        Returns:
+            False if the running batch has no such job
+        """
+        job = self._job(index)
+        if job is None:
+            return False
+        job.cancelled = True
+        job.paused = False
+        if self.scheduler.withdraw(job) or self.scheduler.release(job, requeue=False):
+            self._finish_cancelled(job)
+        return True
+    
+    def pause_all(self) -> None:
+        """Pause the batch: stop dispatching and pause running jobs."""
+        if self.is_running():
+            self.scheduler.pause()
+    
+    def resume_all(self) -> None:
+        """Resume a paused batch."""
+        if self.is_running():
+            self.scheduler.resume()
+    
+    def cancel_all(self) -> list[int]:
+        """
+        Cancel the batch: drop queued jobs and stop running ones.
+        
+        The dropped jobs are recorded in one go and the job callback is not
+        called for them, so cancelling a huge queue stays fast; the caller
+        updates their rows with the returned indices. Running jobs report
+        their cancellation through the job callback as usual.
+        
+        Returns:
+            Indices of the jobs that were dropped from the queue
+        """
+        if not self.is_running():
+            return []
+        
+        # Hold the lock so run_batch() can't close the results in between
+        with self._jobs_lock:
+            removed = self.scheduler.cancel()
+            for job in removed:
+                job.cancelled = True
+            self.results.extend_cancelled([job.url for job in removed])
+            self.completed += len(removed)
+        return [job.index for job in removed]
+    
+    def new_urls(self, urls: list[str]) -> list[str]:
+        """
+        Drop URLs that the current batch already has, keeping the order.
+        
+        Args:
+            urls: URLs about to be queued with add_jobs()
+            
+        Returns:
+            URLs not yet in the batch, each listed once
+        """
+        with self._jobs_lock:
+            return [url for url in dict.fromkeys(urls) if url not in self._batch_urls]
+    
+    def add_jobs(self, urls: list[str], priority: Priority = Priority.NORMAL) -> bool:
+        """
+        Queue more URLs into the running batch.
+        
+        Job indices continue from the previous jobs, in the order given.
+        
+        Args:
+            urls: URLs to download
+            priority: Lane to queue them in
             
-            # Call the progress callback
-            self.progress_callback(self.current_index, self.total_urls, title)
+        Returns:
+            False if no batch is running (the URLs were not queued)
+        """
+        with self._jobs_lock:
+            if self.scheduler is None:
+                return False
+            jobs = [
+                Job(self.total_urls + offset, url, priority)
+                for offset, url in enumerate(urls)
+            ]
+            if not self.scheduler.put(*jobs):
+                return False
+            self.jobs.extend(jobs)
+            self._batch_urls.update(urls)
+            self.total_urls += len(jobs)
+            return True
+    
+    def lane_stats(self) -> list[LaneStats]:
+        """
+        Get start latency statistics for the current or last batch.
+        
+        Returns:
+            LaneStats per lane, most urgent first
+        """
+        return self.scheduler.lane_stats() if self.scheduler is not None else []
     
     def download_videos(
         self,
         urls: list[str],
         format_type: str,
         quality: str,
-        progress_callback: Callable[[int, int, str], None]
-    ) -> list[DownloadResult]:
+        progress_callback: Callable[[int, int, str], None],
+        job_callback: Optional[Callable[[int, dict], None]] = None,
+        spill_path: Optional[str] = None,
+        priority: Priority = Priority.NORMAL
+    ) -> ResultLog:
         """
         Download multiple videos/audio files.
         
+        Jobs run on max_workers worker threads through a LaneScheduler; more
+        URLs can be queued with add_jobs() until the batch finishes, and jobs
+        can be paused or cancelled individually or all at once.
+        
+        Args:
+            urls: List of YouTube URLs to download
+            format_type: "video" or "audio"
+            quality: Quality selection
+            progress_callback: Callback function for progress updates
+            job_callback: Optional callback receiving (job_index, changed_fields)
+                for per-job status, speed and ETA updates
+            spill_path: Optional JSONL file to stream results to instead of
+                keeping them in memory
+            priority: Lane for the initial URLs
+            
+        Returns:
+            ResultLog of DownloadResult objects
+        """
+        self.start_batch(urls, priority, spill_path)
+        return self.run_batch(format_type, quality, progress_callback, job_callback)
+    
+    def start_batch(
+        self,
+        urls: list[str],
+        priority: Priority = Priority.NORMAL,
+        spill_path: Optional[str] = None
+    ) -> ResultLog:
+        """
+        Create the scheduler, jobs and result log for a new batch.
+        
+        This is cheap and runs on the caller's thread, so add_jobs() and the
+        pause and cancel controls act on this batch as soon as it returns,
+        before run_batch() has loaded yt-dlp.
+        
         Args:
             urls: List of YouTube URLs to download
+            priority: Lane for the initial URLs
+            spill_path: Optional JSONL file to stream results to instead of
+                keeping them in memory
+            
+        Returns:
+            The batch's (still empty) ResultLog
+        """
+        self.ensure_download_dir()
+        results = ResultLog(spill_path)
+        
+        with self._jobs_lock:
+            self.scheduler = LaneScheduler()
+            self.jobs = []
+            self._batch_urls = set()
+            self.results = results
+            self.total_urls = 0
+            self.completed = 0
+        self.add_jobs(urls, priority)
+        return results
+    
+    def run_batch(
+        self,
+        format_type: str,
+        quality: str,
+        progress_callback: Callable[[int, int, str], None],
+        job_callback: Optional[Callable[[int, dict], None]] = None
+    ) -> ResultLog:
+        """
+        Download the batch created by start_batch(), blocking until it ends.
+        
+        Args:
             format_type: "video" or "audio"
             quality: Quality selection
             progress_callback: Callback function for progress updates
+            job_callback: Optional callback receiving (job_index, changed_fields)
             
         Returns:
-            List of DownloadResult objects
+            ResultLog of DownloadResult objects
         """
         self.progress_callback = progress_callback
-        self.total_urls = len(urls)
-        results = []
+        self.job_callback = job_callback
+        results = self.results
         
+        yt_dlp = load_yt_dlp()
         ydl_opts = self.get_ydl_opts(format_type, quality)
         
-        for index, url in enumerate(urls, 1):
-            self.current_index = index
+        workers = [
+            threading.Thread(
+                target=self._worker_loop,
+                args=(yt_dlp, ydl_opts),
+                daemon=True
+            )
+            for _ in range(self.max_workers)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        
+        with self._jobs_lock:
+            results.close()
+        return results
+    
+    def _report(self, job: Job, fields: dict) -> None:
+        """Forward a job update to the job callback, if any."""
+        if self.job_callback:
+            self.job_callback(job.index, fields)
+    
+    def _finish(self, job: Job, result: DownloadResult, fields: dict) -> None:
+        """
+        Record a job's final result.
+        
+        Args:
+            job: Job that ended
+            result: Its result
+            fields: Final JobRow fields for the job callback
+        """
+        with self._jobs_lock:
+            self.results.append(result)
+            self.completed += 1
+        self._report(job, fields)
+    
+    def _finish_cancelled(self, job: Job) -> None:
+        """Record a job as cancelled."""
+        self._finish(
+            job,
+            DownloadResult(url=job.url, status=JobStatus.CANCELLED),
+            {'status': JobStatus.CANCELLED, 'speed': None, 'eta': None},
+        )
+    
+    def _worker_loop(self, yt_dlp, ydl_opts: dict) -> None:
+        """
+        Run jobs from the scheduler until the batch is finished.
+        
+        Args:
+            yt_dlp: The yt_dlp module
+            ydl_opts: Options shared by every job in the batch
+        """
+        scheduler = self.scheduler
+        
+        while (job := scheduler.get()) is not None:
+            # Requests made while the job was queued take effect before connecting
+            if job.cancelled:
+                self._finish_cancelled(job)
+                scheduler.task_done(job)
+                continue
+            if job.paused:
+                self._report(job, {'status': JobStatus.PAUSED})
+                scheduler.hold(job)
+                continue
             
+            self._report(job, {'status': JobStatus.STARTING})
+            opts = dict(
+                ydl_opts,
+                progress_hooks=[functools.partial(self.progress_hook, job=job)],
+                postprocessor_hooks=[functools.partial(self.postprocessor_hook, job=job)],
+            )
             try:
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    info = ydl.extract_info(url, download=True)
+                with yt_dlp.YoutubeDL(opts) as ydl:
+                    info = ydl.extract_info(job.url, download=True)
                     title = info.get('title', 'Unknown')
-                    
-                    results.append(DownloadResult(
-                        url=url,
-                        success=True,
-                        message=f"Successfully downloaded: {title}",
-                        filename=title
-                    ))
+                self._finish(
+                    job,
+                    DownloadResult(url=job.url, status=JobStatus.DONE, filename=title),
+                    {
+                        'status': JobStatus.DONE, 'title': title, 'percent': 1.0,
+                        'speed': None, 'eta': None,
+                    },
+                )
+            except JobCancelled:
+                self._finish_cancelled(job)
+            except JobInterrupted as e:
+                self._report(job, {'status': JobStatus.PAUSED, 'speed': None, 'eta': None})
+                if isinstance(e, JobPaused):
+                    # Held if the job itself was paused, requeued if the batch was
+                    scheduler.hold(job)
+                else:
+                    scheduler.task_done(job, requeue=True)
+                continue
             except Exception as e:
-                results.append(DownloadResult(
-                    url=url,
-                    success=False,
-                    message=f"Failed to download {url}: {str(e)}"
-                ))
+                error = classify_error(e)
+                self._finish(
+                    job,
+                    DownloadResult(url=job.url, status=JobStatus.FAILED, error=error),
+                    {
+                        'status': JobStatus.FAILED, 'error': error,
+                        'speed': None, 'eta': None,
+                    },
+                )
+            scheduler.task_done(job)
+
+
+class JobTable(ctk.CTkFrame):
+    """
+    Virtualized per-job table.
+    
+    A fixed pool of row widgets is reused for whichever slice of the model is
+    scrolled into view, so the widget count stays constant no matter how many
+    jobs are queued.
+    """
+    
+    COLUMNS = (("Title / URL", 310), ("Status", 150), ("Speed", 100), ("ETA", 70))
+    
+    def __init__(self, master, model: JobModel, visible_rows: int = 8) -> None:
+        """
+        Initialize the job table.
         
-        return results
+        Args:
+            master: Parent widget
+            model: Job model to display
+            visible_rows: Number of rows rendered at once
+        """
+        super().__init__(master)
+        self.model = model
+        self.visible_rows = visible_rows
+        self.first_row = 0
+        self.row_count = 0
+        self.selected: Optional[int] = None
+        self.grid_columnconfigure(0, weight=1)
+        
+        # Header row
+        header = ctk.CTkFrame(self, fg_color="transparent")
+        header.grid(row=0, column=0, sticky="ew", padx=5, pady=(5, 0))
+        for column, (text, width) in enumerate(self.COLUMNS):
+            header.grid_columnconfigure(column, weight=1 if column == 0 else 0)
+            ctk.CTkLabel(
+                header,
+                text=text,
+                width=width,
+                anchor="w",
+                font=ctk.CTkFont(size=12, weight="bold")
+            ).grid(row=0, column=column, sticky="ew")
+        
+        # Fixed pool of row labels
+        body = ctk.CTkFrame(self, fg_color="transparent")
+        body.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
+        self.cells: list[list[ctk.CTkLabel]] = []
+        self.cell_text: list[list[str]] = []
+        for row in range(visible_rows):
+            cells = []
+            for column, (_, width) in enumerate(self.COLUMNS):
+                body.grid_columnconfigure(column, weight=1 if column == 0 else 0)
+                label = ctk.CTkLabel(
+                    body,
+                    text="",
+                    width=width,
+                    height=20,
+                    anchor="w",
+                    font=ctk.CTkFont(size=12)
+                )
+                label.grid(row=row, column=column, sticky="ew")
+                label.bind("<MouseWheel>", self.on_mouse_wheel)
+                label.bind("<Button-4>", self.on_mouse_wheel)
+                label.bind("<Button-5>", self.on_mouse_wheel)
+                label.bind("<Button-1>", lambda event, slot=row: self.select_slot(slot))
+                cells.append(label)
+            self.cells.append(cells)
+            self.cell_text.append([""] * len(self.COLUMNS))
+        
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.on_scroll)
+        self.scrollbar.grid(row=1, column=1, sticky="ns", pady=5)
+        self.scrollbar.set(0, 1)
+    
+    def select_slot(self, slot: int) -> None:
+        """
+        Select the job shown in a pooled row.
+        
+        Args:
+            slot: Index into the row widget pool
+        """
+        index = self.first_row + slot
+        if index < len(self.model):
+            previous, self.selected = self.selected, index
+            if previous is not None and 0 <= previous - self.first_row < self.visible_rows:
+                self.render_row(previous - self.first_row)
+            self.render_row(slot)
+    
+    def max_first_row(self) -> int:
+        """Return the largest valid index for the top visible row."""
+        return max(0, len(self.model) - self.visible_rows)
+    
+    def scroll_to(self, first_row: int) -> None:
+        """
+        Scroll so the given job is the top visible row.
+        
+        Args:
+            first_row: Zero-based job index
+        """
+        first_row = min(max(0, first_row), self.max_first_row())
+        if first_row != self.first_row:
+            self.first_row = first_row
+            self.render_all()
+    
+    def on_scroll(self, action: str, value: str, unit: Optional[str] = None) -> None:
+        """
+        Handle scrollbar commands using the Tk yview protocol.
+        
+        Args:
+            action: "moveto" or "scroll"
+            value: Fraction for "moveto", step count for "scroll"
+            unit: "units" or "pages" for "scroll"
+        """
+        if action == "moveto":
+            self.scroll_to(round(float(value) * len(self.model)))
+        else:
+            step = self.visible_rows if unit == "pages" else 1
+            self.scroll_to(self.first_row + int(value) * step)
+    
+    def on_mouse_wheel(self, event) -> None:
+        """
+        Scroll three rows per mouse wheel notch.
+        
+        Args:
+            event: Tk mouse wheel event
+        """
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self.scroll_to(self.first_row - 3)
+        else:
+            self.scroll_to(self.first_row + 3)
+    
+    def render_row(self, slot: int) -> None:
+        """
+        Paint one pooled row from the model, touching only changed cells.
+        
+        Args:
+            slot: Index into the row widget pool
+        """
+        index = self.first_row + slot
+        if index < len(self.model):
+            job = self.model.row(index)
+            marker = "» " if index == self.selected else ""
+            texts = [
+                marker + (job.title or job.url)[:60],
+                job.status_text,
+                format_speed(job.speed),
+                format_eta(job.eta),
+            ]
+        else:
+            texts = [""] * len(self.COLUMNS)
+        
+        for column, text in enumerate(texts):
+            if self.cell_text[slot][column] != text:
+                self.cell_text[slot][column] = text
+                self.cells[slot][column].configure(text=text)
+    
+    def render_all(self) -> None:
+        """Repaint every visible row and the scrollbar position."""
+        for slot in range(self.visible_rows):
+            self.render_row(slot)
+        self.update_scrollbar()
+    
+    def update_scrollbar(self) -> None:
+        """Resize the scrollbar thumb to the current row count."""
+        total = self.row_count = len(self.model)
+        if total:
+            self.scrollbar.set(
+                self.first_row / total,
+                min(1.0, (self.first_row + self.visible_rows) / total)
+            )
+        else:
+            self.scrollbar.set(0, 1)
+    
+    def apply_changes(self, reset: bool, changed: set[int]) -> None:
+        """
+        Repaint only the visible rows affected by a batch of model changes.
+        
+        Args:
+            reset: True if the model was replaced since the last batch
+            changed: Indices of jobs that changed
+        """
+        if reset:
+            self.first_row = 0
+            self.selected = None
+            self.render_all()
+            return
+        
+        for index in changed:
+            slot = index - self.first_row
+            if 0 <= slot < self.visible_rows:
+                self.render_row(slot)
+        
+        if len(self.model) != self.row_count:
+            self.update_scrollbar()
 
 
 class App(ctk.CTk):
     """Main application GUI."""
     
+    REFRESH_MS = 16
+    VALIDATE_DELAY_MS = 150
+    SPILL_THRESHOLD = 10000
+    
     def __init__(self) -> None:
         """Initialize the application."""
         super().__init__()
         
         # Configure window
         self.title("YouTube Bulk Downloader")
-        self.geometry("700x600")
+        self.geometry("720x680")
         
         # Set appearance
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
         
         # Initialize downloader engine
-        download_dir = os.path.join(os.path.dirname(__file__), "downloads")
-        self.engine = DownloaderEngine(download_dir)
+        app_dir = os.path.dirname(__file__)
+        self.engine = DownloaderEngine(
+            os.path.join(app_dir, "downloads"),
+            capability_cache=os.path.join(app_dir, ".ffmpeg_capabilities.json")
+        )
+        
+        # Per-job state shared with the worker thread and incremental validator
+        self.job_model = JobModel()
+        self.validator = UrlValidator(self.engine.is_valid_url)
+        self.validate_after_id: Optional[str] = None
+        self.progress_state: Optional[tuple[int, int, str]] = None
+        self.downloading = False
         
         # Setup UI
         self.setup_ui()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
         
-        # Check FFmpeg on startup
-        self.check_ffmpeg_availability()
+        # Once the window is up, probe FFmpeg and import yt-dlp in the background;
+        # the FFmpeg warning appears when the probe finishes
+        self.after_idle(self.start_background_init)
+        
+        # Start the frame loop that applies batched model changes
+        self.refresh_jobs()
+    
+    def start_background_init(self) -> None:
+        """Kick off environment probes and deferred imports off the main thread."""
+        self.engine.start_capability_probe(
+            lambda capabilities: self.after(0, self.check_ffmpeg_availability, capabilities)
+        )
+        preload_yt_dlp()
     
     def setup_ui(self) -> None:
         """Set up the user interface."""
@@ -262,7 +1909,7 @@ class App(ctk.CTk):
             text="YouTube Bulk Downloader",
             font=ctk.CTkFont(size=24, weight="bold")
         )
-        title_label.grid(row=0, column=0, padx=20, pady=(20, 10), sticky="w")
+        title_label.grid(row=0, column=0, padx=20, pady=(15, 5), sticky="w")
         
         # URL input label
         url_label = ctk.CTkLabel(
@@ -270,49 +1917,62 @@ class App(ctk.CTk):
             text="Enter YouTube URLs (one per line):",
             font=ctk.CTkFont(size=14)
         )
-        url_label.grid(row=1, column=0, padx=20, pady=(10, 5), sticky="w")
+        url_label.grid(row=1, column=0, padx=20, pady=(5, 5), sticky="w")
         
         # URL input textbox
         self.url_textbox = ctk.CTkTextbox(
             self,
-            height=150,
+            height=110,
             font=ctk.CTkFont(size=12)
         )
         self.url_textbox.grid(row=2, column=0, padx=20, pady=5, sticky="ew")
+        self.url_textbox.bind("<<Modified>>", self.on_urls_modified)
         
-        # Format selection label
-        format_label = ctk.CTkLabel(
+        # Live validation summary
+        self.validation_label = ctk.CTkLabel(
             self,
-            text="Format:",
-            font=ctk.CTkFont(size=14)
+            text="",
+            font=ctk.CTkFont(size=12)
         )
-        format_label.grid(row=3, column=0, padx=20, pady=(15, 5), sticky="w")
+        self.validation_label.grid(row=3, column=0, padx=20, pady=0, sticky="w")
+        
+        # Format, quality and priority side by side to keep the window short
+        options = ctk.CTkFrame(self, fg_color="transparent")
+        options.grid(row=4, column=0, padx=20, pady=(5, 0), sticky="ew")
+        for column, text in enumerate(("Format:", "Quality:", "Priority:")):
+            options.grid_columnconfigure(column, weight=1, uniform="options")
+            label = ctk.CTkLabel(
+                options,
+                text=text,
+                font=ctk.CTkFont(size=14)
+            )
+            label.grid(row=0, column=column, padx=(0 if column == 0 else 10, 0), sticky="w")
         
         # Format selector
         self.format_selector = ctk.CTkSegmentedButton(
-            self,
+            options,
             values=["Video (MP4)", "Audio Only (MP3)"],
             command=self.on_format_change
         )
         self.format_selector.set("Video (MP4)")
-        self.format_selector.grid(row=4, column=0, padx=20, pady=5, sticky="ew")
-        
-        # Quality selection label
-        quality_label = ctk.CTkLabel(
-            self,
-            text="Quality:",
-            font=ctk.CTkFont(size=14)
-        )
-        quality_label.grid(row=5, column=0, padx=20, pady=(15, 5), sticky="w")
+        self.format_selector.grid(row=1, column=0, pady=5, sticky="ew")
         
         # Quality selector
         self.quality_selector = ctk.CTkComboBox(
-            self,
+            options,
             values=["Best Available", "1080p", "720p", "480p"],
             state="readonly"
         )
         self.quality_selector.set("Best Available")
-        self.quality_selector.grid(row=6, column=0, padx=20, pady=5, sticky="ew")
+        self.quality_selector.grid(row=1, column=1, padx=(10, 0), pady=5, sticky="ew")
+        
+        # Priority selector (URLs added during a download join its queue in this lane)
+        self.priority_selector = ctk.CTkSegmentedButton(
+            options,
+            values=[priority.label for priority in Priority]
+        )
+        self.priority_selector.set(Priority.NORMAL.label)
+        self.priority_selector.grid(row=1, column=2, padx=(10, 0), pady=5, sticky="ew")
         
         # Download button
         self.download_button = ctk.CTkButton(
@@ -322,12 +1982,12 @@ class App(ctk.CTk):
             height=40,
             font=ctk.CTkFont(size=16, weight="bold")
         )
-        self.download_button.grid(row=7, column=0, padx=20, pady=20, sticky="ew")
+        self.download_button.grid(row=5, column=0, padx=20, pady=10, sticky="ew")
         
         # Progress bar
         self.progress_bar = ctk.CTkProgressBar(self)
         self.progress_bar.set(0)
-        self.progress_bar.grid(row=8, column=0, padx=20, pady=5, sticky="ew")
+        self.progress_bar.grid(row=6, column=0, padx=20, pady=5, sticky="ew")
         
         # Status label
         self.status_label = ctk.CTkLabel(
@@ -335,7 +1995,119 @@ class App(ctk.CTk):
             text="Ready",
             font=ctk.CTkFont(size=12)
         )
-        self.status_label.grid(row=9, column=0, padx=20, pady=5, sticky="w")
+        self.status_label.grid(row=7, column=0, padx=20, pady=5, sticky="w")
+        
+        # Per-job table
+        self.job_table = JobTable(self, self.job_model, visible_rows=5)
+        self.job_table.grid(row=8, column=0, padx=20, pady=5, sticky="nsew")
+        self.grid_rowconfigure(8, weight=1)
+        
+        # Job and batch controls
+        controls = ctk.CTkFrame(self, fg_color="transparent")
+        controls.grid(row=9, column=0, padx=20, pady=(5, 15), sticky="ew")
+        for column, (text, command) in enumerate((
+            ("Pause Job", self.pause_selected),
+            ("Resume Job", self.resume_selected),
+            ("Cancel Job", self.cancel_selected),
+            ("Pause All", self.toggle_pause_all),
+            ("Cancel All", self.cancel_all),
+        )):
+            controls.grid_columnconfigure(column, weight=1)
+            button = ctk.CTkButton(controls, text=text, command=command, width=100)
+            button.grid(row=0, column=column, padx=3, sticky="ew")
+            if text == "Pause All":
+                self.pause_all_button = button
+    
+    def pause_selected(self) -> None:
+        """Pause the job selected in the job table."""
+        if self.downloading and self.job_table.selected is not None:
+            self.engine.pause_job(self.job_table.selected)
+    
+    def resume_selected(self) -> None:
+        """Resume the job selected in the job table."""
+        if self.downloading and self.job_table.selected is not None:
+            self.engine.resume_job(self.job_table.selected)
+    
+    def cancel_selected(self) -> None:
+        """Cancel the job selected in the job table."""
+        if self.downloading and self.job_table.selected is not None:
+            self.engine.cancel_job(self.job_table.selected)
+    
+    def toggle_pause_all(self) -> None:
+        """Pause or resume the whole batch."""
+        if not self.downloading:
+            return
+        if self.engine.is_paused():
+            self.engine.resume_all()
+            self.pause_all_button.configure(text="Pause All")
+        elif self.engine.is_running():
+            self.engine.pause_all()
+            self.pause_all_button.configure(text="Resume All")
+    
+    def cancel_all(self) -> None:
+        """Cancel the whole batch."""
+        if self.downloading:
+            self.job_model.update_many(
+                self.engine.cancel_all(), status=JobStatus.CANCELLED, speed=None, eta=None
+            )
+    
+    def on_close(self) -> None:
+        """Cancel any running batch so downloads stop, then close the window."""
+        self.engine.cancel_all()
+        self.destroy()
+    
+    def on_urls_modified(self, event=None) -> None:
+        """
+        Schedule background validation shortly after the URL text changes.
+        
+        Args:
+            event: Tk virtual event (unused)
+        """
+        self.url_textbox.edit_modified(False)
+        if self.validate_after_id is not None:
+            self.after_cancel(self.validate_after_id)
+        self.validate_after_id = self.after(self.VALIDATE_DELAY_MS, self.validate_in_background)
+    
+    def validate_in_background(self) -> None:
+        """Hand the current URL text to the background validator."""
+        self.validate_after_id = None
+        url_text = self.url_textbox.get("1.0", "end-1c")
+        self.validator.submit(
+            url_text,
+            lambda valid, invalid: self.after(0, self.on_validation_result, valid, invalid)
+        )
+    
+    def on_validation_result(self, valid_urls: list[str], invalid_urls: list[str]) -> None:
+        """
+        Show the latest live validation summary.
+        
+        Args:
+            valid_urls: URLs that passed validation
+            invalid_urls: URLs that failed validation
+        """
+        if not valid_urls and not invalid_urls:
+            self.validation_label.configure(text="")
+            return
+        text = f"{len(valid_urls)} valid"
+        if invalid_urls:
+            text += f", {len(invalid_urls)} invalid (e.g. {invalid_urls[0][:40]})"
+        self.validation_label.configure(text=text)
+    
+    def refresh_jobs(self) -> None:
+        """Apply batched job and progress changes once per frame."""
+        reset, changed = self.job_model.drain()
+        if reset or changed:
+            self.job_table.apply_changes(reset, changed)
+        
+        if self.progress_state is not None:
+            current, total, title = self.progress_state
+            self.progress_state = None
+            self.progress_bar.set(current / total if total > 0 else 0)
+            self.status_label.configure(
+                text=f"Downloading {current} of {total}: {title[:50]}..."
+            )
+        
+        self.after(self.REFRESH_MS, self.refresh_jobs)
     
     def on_format_change(self, value: str) -> None:
         """
@@ -349,9 +2121,17 @@ class App(ctk.CTk):
         else:
             self.quality_selector.configure(state="readonly")
     
-    def check_ffmpeg_availability(self) -> None:
-        """Check if FFmpeg is available and warn if not."""
-        if not self.engine.check_ffmpeg():
+    def check_ffmpeg_availability(self, capabilities: FFmpegCapabilities) -> None:
+        """
+        Warn if the background FFmpeg probe found no FFmpeg.
+        
+        Args:
+            capabilities: Result of the probe
+        """
+        if capabilities.available:
+            if self.status_label.cget("text") == "Ready":
+                self.status_label.configure(text=f"Ready (FFmpeg {capabilities.version})")
+        else:
             self.show_warning(
                 "FFmpeg Not Found",
                 "FFmpeg is not installed or not in your system PATH.\n\n"
@@ -377,8 +2157,8 @@ class App(ctk.CTk):
             self.show_error("No URLs provided. Please enter at least one YouTube URL.")
             return
         
-        # Validate URLs
-        valid_urls, invalid_urls = self.engine.validate_urls(urls)
+        # Validate URLs (mostly served from the incremental validator's cache)
+        valid_urls, invalid_urls = self.validator.classify(urls)
         
         if invalid_urls:
             self.show_error(
@@ -391,12 +2171,46 @@ class App(ctk.CTk):
             self.show_error("No valid YouTube URLs found.")
             return
         
+        priority = Priority[self.priority_selector.get().upper()]
+        
+        # While a batch is running, new URLs join its queue in the chosen lane
+        if self.downloading:
+            # The textbox still holds the running batch's URLs; queue only the rest
+            new_urls = self.engine.new_urls(valid_urls)
+            if not new_urls:
+                self.status_label.configure(text="These URLs are already in the queue")
+                return
+            self.job_model.extend(new_urls)
+            if self.engine.add_jobs(new_urls, priority):
+                self.status_label.configure(
+                    text=f"Queued {len(new_urls)} more URL(s) as {priority.label}"
+                )
+            else:
+                # The batch ended between clicks; its completion handler is pending
+                self.job_model.truncate(self.engine.total_urls)
+                self.status_label.configure(
+                    text="The current batch is finishing. Click Download again to start a new one."
+                )
+            return
+        
         # Get format and quality
         format_type = "audio" if self.format_selector.get() == "Audio Only (MP3)" else "video"
         quality = self.quality_selector.get()
         
-        # Check FFmpeg and warn if needed for high quality
-        if not self.engine.check_ffmpeg():
+        # Check FFmpeg and warn if needed for high quality. Never wait for the
+        # background probe here; if it hasn't finished, its own warning follows.
+        capabilities = self.engine.capabilities
+        if capabilities is None:
+            pass
+        elif format_type == "audio" and capabilities.available and capabilities.audio_codec != "mp3":
+            self.show_info(
+                "Note: MP3 Encoder Not Available",
+                "This FFmpeg build has no MP3 encoder.\n"
+                + (f"Audio will be converted to {capabilities.audio_codec.upper()} instead."
+                   if capabilities.audio_codec else
+                   "Audio will be downloaded in original format.")
+            )
+        elif not capabilities.available:
             if format_type == "audio":
                 self.show_info(
                     "Note: FFmpeg Not Available",
@@ -410,34 +2224,43 @@ class App(ctk.CTk):
                     "Install FFmpeg for best quality downloads."
                 )
         
-        # Disable download button
-        self.download_button.configure(state="disabled")
+        # The download button now adds URLs to the running queue
+        self.downloading = True
+        self.download_button.configure(text="Add to Queue")
         self.status_label.configure(text="Starting download...")
         self.progress_bar.set(0)
+        self.job_model.reset(valid_urls)
+        
+        # Very large batches stream their results to disk
+        spill_path = None
+        if len(valid_urls) >= self.SPILL_THRESHOLD:
+            spill_path = os.path.join(self.engine.download_dir, "download_results.jsonl")
+        
+        # Create the batch here so queueing and controls act on it right away
+        self.engine.start_batch(valid_urls, priority, spill_path)
         
         # Start download in separate thread
         thread = threading.Thread(
             target=self.download_thread_worker,
-            args=(valid_urls, format_type, quality),
+            args=(format_type, quality),
             daemon=True
         )
         thread.start()
     
-    def download_thread_worker(self, urls: list[str], format_type: str, quality: str) -> None:
+    def download_thread_worker(self, format_type: str, quality: str) -> None:
         """
-        Worker thread for downloading videos.
+        Worker thread for downloading the batch created in start_download.
         
         Args:
-            urls: List of URLs to download
             format_type: "video" or "audio"
             quality: Quality selection
         """
         try:
-            results = self.engine.download_videos(
-                urls,
+            results = self.engine.run_batch(
                 format_type,
                 quality,
-                self.update_progress
+                self.update_progress,
+                self.job_model.update_fields
             )
             
             # Update GUI on main thread
@@ -445,7 +2268,13 @@ class App(ctk.CTk):
         except Exception as e:
             self.after(0, self.show_error, f"Download error: {str(e)}")
         finally:
-            self.after(0, lambda: self.download_button.configure(state="normal"))
+            self.after(0, self.on_download_finished)
+    
+    def on_download_finished(self) -> None:
+        """Restore the download button once the batch has ended."""
+        self.downloading = False
+        self.download_button.configure(text="Download")
+        self.pause_all_button.configure(text="Pause All")
     
     def update_progress(self, current: int, total: int, title: str) -> None:
         """
@@ -456,25 +2285,23 @@ class App(ctk.CTk):
             total: Total number of downloads
             title: Title of current download
         """
-        # Calculate progress
-        progress = current / total if total > 0 else 0
-        
-        # Update GUI on main thread
-        self.after(0, lambda: self.progress_bar.set(progress))
-        self.after(0, lambda: self.status_label.configure(
-            text=f"Downloading {current} of {total}: {title[:50]}..."
-        ))
+        # Picked up by refresh_jobs on the main thread; only the latest value matters
+        self.progress_state = (current, total, title)
     
-    def on_download_complete(self, results: list[DownloadResult]) -> None:
+    def on_download_complete(self, results: ResultLog) -> None:
         """
         Handle download completion.
         
         Args:
-            results: List of download results
+            results: Log of download results
         """
-        # Count successes and failures
-        successes = sum(1 for r in results if r.success)
-        failures = len(results) - successes
+        successes = results.succeeded
+        failures = results.failed
+        cancelled = results.cancelled
+        
+        # Flush pending row updates before showing the summary
+        self.progress_state = None
+        self.job_table.apply_changes(*self.job_model.drain())
         
         # Update status
         self.status_label.configure(text="Download Complete!")
@@ -482,12 +2309,21 @@ class App(ctk.CTk):
         
         # Show completion message
         message = f"Download complete!\n\nSuccessful: {successes}\nFailed: {failures}"
+        if cancelled:
+            message += f"\nCancelled: {cancelled}"
         
         if failures > 0:
-            failed_urls = [r.url for r in results if not r.success]
-            message += f"\n\nFailed URLs:\n" + "\n".join(failed_urls[:3])
-            if len(failed_urls) > 3:
-                message += f"\n... and {len(failed_urls) - 3} more"
+            failed_urls = results.failed_urls(3)
+            message += f"\n\nFailed URLs:\n" + "\n".join(failed_urls)
+            if failures > 3:
+                message += f"\n... and {failures - 3} more"
+        
+        if results.spill_path:
+            message += f"\n\nFull results: {results.spill_path}"
+        
+        lane_stats = self.engine.lane_stats()
+        if len(lane_stats) > 1:
+            message += "\n\nWait before start, by lane:\n" + "\n".join(map(str, lane_stats))
         
         self.show_info("Download Complete", message)
     
@@ -3,9 +3,32 @@ Unit tests for YouTube Bulk Downloader
 """
 
 import os
+import sys
+import time
+import types
+import threading
+import subprocess
+import http.server
 import pytest
 from hypothesis import given, strategies as st
-from main import DownloaderEngine, DownloadResult
+import main
+from main import (
+    DownloaderEngine,
+    DownloadResult,
+    ErrorCode,
+    FFmpegCapabilities,
+    Job,
+    JobModel,
+    JobStatus,
+    LaneScheduler,
+    Priority,
+    ResultLog,
+    UrlValidator,
+    classify_error,
+    format_eta,
+    format_speed,
+    probe_ffmpeg,
+)
 
 
 class TestDownloaderEngine:
@@ -23,9 +46,21 @@ class TestDownloaderEngine:
             shutil.rmtree(self.download_dir)
     
     def test_download_directory_creation(self):
-        """Test that download directory is created."""
+        """Test that download directory is created on first download, not at startup."""
+        assert not os.path.exists(self.download_dir)
+        self.engine.ensure_download_dir()
         assert os.path.exists(self.download_dir)
     
+    def test_import_does_not_load_yt_dlp(self):
+        """Test that yt-dlp is imported lazily."""
+        completed = subprocess.run(
+            [sys.executable, "-c", "import sys, main; print('yt_dlp' in sys.modules)"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True
+        )
+        assert completed.stdout.strip() == "False"
+    
     def test_validate_urls_valid(self):
         """Test URL validation with valid YouTube URLs."""
         urls = [
@@ -122,6 +157,593 @@ class TestDownloaderEngine:
             # Without FFmpeg, no postprocessors
             assert 'postprocessors' not in opts
 
+    def test_progress_hook_reports_job_fields(self):
+        """Test that the progress hook forwards per-job speed and ETA."""
+        updates = []
+        self.engine.job_callback = lambda index, fields: updates.append((index, fields))
+        self.engine.total_urls = 3
+        self.engine.progress_hook({
+            'status': 'downloading',
+            'filename': '/tmp/video.mp4',
+            'downloaded_bytes': 50,
+            'total_bytes': 200,
+            'speed': 1024.0,
+            'eta': 7,
+        }, Job(1, "https://youtu.be/abc", Priority.NORMAL))
+        index, fields = updates[-1]
+        assert index == 1
+        assert fields['status'] == JobStatus.DOWNLOADING
+        assert fields['percent'] == 0.25
+        assert fields['speed'] == 1024.0
+        assert fields['eta'] == 7
+
+    def test_start_batch_accepts_jobs_before_run(self):
+        """Test that a batch takes new jobs as soon as it is created."""
+        self.engine.start_batch(["a"], Priority.BULK)
+        assert self.engine.add_jobs(["urgent"], Priority.URGENT)
+        assert [job.url for job in self.engine.jobs] == ["a", "urgent"]
+        assert [job.index for job in self.engine.jobs] == [0, 1]
+        assert len(self.engine.scheduler) == 2
+    
+    def test_add_same_urls_twice_queues_nothing_new(self):
+        """Test that re-submitting the textbox only queues URLs not yet in the batch."""
+        self.engine.start_batch(["a", "b"])
+        text = ["a", "b", "c", "c"]
+        assert self.engine.add_jobs(self.engine.new_urls(text), Priority.URGENT)
+        assert self.engine.new_urls(text) == []
+        assert [job.url for job in self.engine.jobs] == ["a", "b", "c"]
+        assert len(self.engine.scheduler) == 3
+    
+    def test_get_ydl_opts_memoized(self):
+        """Test that option building runs once per format, quality and profile."""
+        calls = []
+        build = self.engine._build_ydl_opts
+        self.engine._build_ydl_opts = lambda *args: calls.append(args) or build(*args)
+        first = self.engine.get_ydl_opts("video", "720p")
+        second = self.engine.get_ydl_opts("video", "720p")
+        assert first == second
+        assert first is not second
+        assert len(calls) == 1
+    
+    def test_get_ydl_opts_audio_encoder_fallback(self):
+        """Test that audio falls back to AAC when the MP3 encoder is missing."""
+        self.engine.capabilities = FFmpegCapabilities(
+            path="/usr/bin/ffmpeg",
+            encoders=frozenset({"aac", "libx264"}),
+        )
+        opts = self.engine.get_ydl_opts("audio", "Best Available")
+        assert opts['postprocessors'][0]['preferredcodec'] == 'm4a'
+
+
+FFMPEG_ENCODERS_OUTPUT = """Encoders:
+ V..... = Video
+ ------
+ V....D libx264              libx264 H.264 / AVC / MPEG-4 AVC
+ V....D h264_nvenc           NVIDIA NVENC H.264 encoder
+ A....D aac                  AAC (Advanced Audio Coding)
+ A....D libmp3lame           libmp3lame MP3 (MPEG audio layer 3)
+"""
+
+FFMPEG_MUXERS_OUTPUT = """File formats:
+ D. = Demuxing supported
+ .E = Muxing supported
+ --
+  E mp4             MP4 (MPEG-4 Part 14)
+  E matroska,webm   Matroska
+"""
+
+
+class TestFFmpegProbe:
+    """Tests for the cached FFmpeg capability probe."""
+    
+    def fake_ffmpeg(self, monkeypatch, tmp_path):
+        """Point the probe at a fake binary and record the commands it runs."""
+        binary = tmp_path / "ffmpeg"
+        binary.write_text("")
+        runs = []
+        outputs = {
+            "-version": "ffmpeg version 6.1.1 Copyright (c) 2000-2023",
+            "-encoders": FFMPEG_ENCODERS_OUTPUT,
+            "-muxers": FFMPEG_MUXERS_OUTPUT,
+        }
+        monkeypatch.setattr(main.shutil, "which", lambda name: str(binary))
+        monkeypatch.setattr(
+            main, "_run_ffmpeg",
+            lambda path, arg: runs.append(arg) or outputs[arg]
+        )
+        return binary, runs
+    
+    def test_probe_parses_output(self, monkeypatch, tmp_path):
+        """Test that version, encoders and muxers are parsed."""
+        self.fake_ffmpeg(monkeypatch, tmp_path)
+        capabilities = probe_ffmpeg()
+        assert capabilities.version == "6.1.1"
+        assert {"libx264", "aac", "libmp3lame"} <= capabilities.encoders
+        assert {"mp4", "matroska", "webm"} <= capabilities.muxers
+        assert capabilities.hardware_encoders == ("h264_nvenc",)
+        assert capabilities.audio_codec == "mp3"
+    
+    def test_probe_cached_by_mtime(self, monkeypatch, tmp_path):
+        """Test that the disk cache is reused until the binary changes."""
+        binary, runs = self.fake_ffmpeg(monkeypatch, tmp_path)
+        cache_file = str(tmp_path / "probe.json")
+        
+        first = probe_ffmpeg(cache_file)
+        assert len(runs) == 3
+        assert probe_ffmpeg(cache_file) == first
+        assert len(runs) == 3
+        
+        os.utime(binary, (0, 12345))
+        probe_ffmpeg(cache_file)
+        assert len(runs) == 6
+    
+    def test_probe_without_ffmpeg(self, monkeypatch):
+        """Test that a missing binary yields an empty profile."""
+        monkeypatch.setattr(main.shutil, "which", lambda name: None)
+        capabilities = probe_ffmpeg()
+        assert not capabilities.available
+        assert capabilities.audio_codec is None
+
+
+class TestJobModel:
+    """Tests for JobModel and its display helpers."""
+    
+    def test_reset_creates_queued_rows(self):
+        """Test that reset replaces rows and reports a reset."""
+        model = JobModel()
+        model.reset(["a", "b", "c"])
+        assert len(model) == 3
+        assert model.row(1).status == JobStatus.QUEUED
+        assert model.drain() == (True, set())
+    
+    def test_updates_are_batched(self):
+        """Test that repeated updates coalesce into one set of changed rows."""
+        model = JobModel()
+        model.reset(["a", "b", "c"])
+        model.drain()
+        for percent in (0.1, 0.2, 0.3):
+            model.update(0, status=JobStatus.DOWNLOADING, percent=percent)
+        model.update_fields(2, {'status': JobStatus.FAILED})
+        assert model.drain() == (False, {0, 2})
+        assert model.row(0).percent == 0.3
+        assert model.drain() == (False, set())
+    
+    def test_update_many(self):
+        """Test that a bulk update sets every listed row and marks them changed."""
+        model = JobModel()
+        model.reset(["a", "b", "c"])
+        model.drain()
+        model.update_many([0, 2], status=JobStatus.CANCELLED, speed=None)
+        assert model.drain() == (False, {0, 2})
+        assert [model.row(i).status for i in range(3)] == [
+            JobStatus.CANCELLED, JobStatus.QUEUED, JobStatus.CANCELLED
+        ]
+    
+    def test_failed_row_keeps_url(self):
+        """Test that a failed row keeps its URL and shows the error as status."""
+        model = JobModel()
+        model.reset(["https://youtu.be/abc"])
+        model.update_fields(0, {'status': JobStatus.FAILED, 'error': ErrorCode.PRIVATE})
+        row = model.row(0)
+        assert row.url == "https://youtu.be/abc"
+        assert row.title == ""
+        assert row.status_text == "Failed: Private"
+        model.update(0, status=JobStatus.DOWNLOADING, percent=0.5)
+        assert row.status_text == "50%"
+    
+    def test_format_speed(self):
+        """Test speed formatting."""
+        assert format_speed(None) == "-"
+        assert format_speed(512) == "512.0 B/s"
+        assert format_speed(1.5 * 1024 * 1024) == "1.5 MiB/s"
+    
+    def test_format_eta(self):
+        """Test ETA formatting."""
+        assert format_eta(None) == "-"
+        assert format_eta(65) == "1:05"
+        assert format_eta(3725) == "1:02:05"
+
+
+class TestResultLog:
+    """Tests for compact result records and the result log."""
+    
+    def make_results(self):
+        """Build one success and two failures."""
+        return [
+            DownloadResult("u1", JobStatus.DONE, filename="First"),
+            DownloadResult("u2", JobStatus.FAILED, ErrorCode.PRIVATE),
+            DownloadResult("u3", JobStatus.FAILED, ErrorCode.NETWORK),
+        ]
+    
+    def test_records_are_slotted(self):
+        """Test that records carry no per-instance __dict__."""
+        assert not hasattr(DownloadResult("u", JobStatus.DONE), '__dict__')
+    
+    def test_message_built_from_code(self):
+        """Test that messages are derived from status and error code."""
+        done, private, _ = self.make_results()
+        assert done.success
+        assert done.message == "Successfully downloaded: First"
+        assert not private.success
+        assert private.message == "Failed to download u2: Private"
+    
+    def test_running_counters(self):
+        """Test that counters track results as they are appended."""
+        log = ResultLog()
+        for result in self.make_results():
+            log.append(result)
+        assert (log.succeeded, log.failed, len(log)) == (1, 2, 3)
+        assert log.failed_urls(1) == ["u2"]
+        assert list(log) == self.make_results()
+    
+    def test_spill_to_jsonl(self, tmp_path):
+        """Test that spilled results round-trip through the JSONL file."""
+        spill_path = str(tmp_path / "results.jsonl")
+        log = ResultLog(spill_path)
+        for result in self.make_results():
+            log.append(result)
+        log.close()
+        assert log._results == []
+        assert list(log) == self.make_results()
+        assert log.failed_urls(5) == ["u2", "u3"]
+        with open(spill_path) as f:
+            assert len(f.readlines()) == 3
+    
+    @pytest.mark.parametrize("spill", [False, True])
+    def test_extend_cancelled(self, tmp_path, spill):
+        """Test that bulk-cancelled jobs match appending them one by one."""
+        log = ResultLog(str(tmp_path / "results.jsonl") if spill else None)
+        log.append(DownloadResult("u1", JobStatus.DONE, filename="First"))
+        log.extend_cancelled(["u2", 'u"3'])
+        log.close()
+        assert (log.succeeded, log.cancelled, len(log)) == (1, 2, 3)
+        assert list(log) == [
+            DownloadResult("u1", JobStatus.DONE, filename="First"),
+            DownloadResult("u2", JobStatus.CANCELLED),
+            DownloadResult('u"3', JobStatus.CANCELLED),
+        ]
+    
+    def test_classify_error(self):
+        """Test mapping of yt-dlp error messages to codes."""
+        assert classify_error(Exception("ERROR: [youtube] x: Private video")) == ErrorCode.PRIVATE
+        assert classify_error(Exception("ERROR: Video unavailable")) == ErrorCode.UNAVAILABLE
+        assert classify_error(Exception("HTTP Error 403: Forbidden")) == ErrorCode.NETWORK
+        assert classify_error(Exception("something odd")) == ErrorCode.UNKNOWN
+
+
+class FakeYoutubeDL:
+    """Stand-in for yt_dlp.YoutubeDL that resumes like a .part file would."""
+    
+    STEPS = 20
+    progress: dict = {}
+    finished: list = []
+    
+    def __init__(self, opts):
+        self.hooks = opts['progress_hooks']
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def extract_info(self, url, download=True):
+        while self.progress.get(url, 0) < self.STEPS:
+            for hook in self.hooks:
+                hook({
+                    'status': 'downloading',
+                    'filename': url,
+                    'downloaded_bytes': self.progress.get(url, 0),
+                    'total_bytes': self.STEPS,
+                })
+            self.progress[url] = self.progress.get(url, 0) + 1
+            time.sleep(0.005)
+        self.finished.append(url)
+        return {'title': url}
+
+
+class TestLaneScheduler:
+    """Tests for priority lanes, weighted-fair dispatch and preemption."""
+    
+    def drain(self, scheduler):
+        """Dispatch every queued job one at a time, returning their priorities."""
+        order = []
+        while (job := scheduler.get()) is not None:
+            order.append(job.priority)
+            scheduler.task_done(job)
+        return order
+    
+    def test_weighted_fair_dispatch(self):
+        """Test that lanes share dispatches in proportion to their weights."""
+        scheduler = LaneScheduler({Priority.URGENT: 3, Priority.NORMAL: 1, Priority.BULK: 1})
+        scheduler.put(*(Job(i, f"u{i}", Priority.URGENT) for i in range(30)))
+        scheduler.put(*(Job(i, f"b{i}", Priority.BULK) for i in range(30)))
+        order = self.drain(scheduler)
+        assert order[:8].count(Priority.URGENT) == 6
+        assert order[:8].count(Priority.BULK) == 2
+        assert len(order) == 60
+        assert scheduler.closed
+        assert not scheduler.put(Job(99, "late", Priority.URGENT))
+    
+    def test_preemption_claimed_once_per_waiting_job(self):
+        """Test that one urgent job pauses only one lower-priority job."""
+        scheduler = LaneScheduler()
+        scheduler.put(Job(0, "b0", Priority.BULK), Job(1, "b1", Priority.BULK))
+        running = [scheduler.get(), scheduler.get()]
+        assert all(job.preemptible for job in running)
+        
+        scheduler.put(Job(2, "urgent", Priority.URGENT))
+        assert scheduler.claim_preemption(Priority.BULK)
+        assert not scheduler.claim_preemption(Priority.BULK)
+        assert not scheduler.claim_preemption(Priority.URGENT)
+        
+        scheduler.task_done(running[0], requeue=True)
+        assert scheduler.get().url == "urgent"
+        assert scheduler.get().url == "b0"
+        assert running[0].preemptions == 1
+    
+    def test_lane_stats_report_waits(self):
+        """Test that wait latency is recorded per lane."""
+        scheduler = LaneScheduler()
+        scheduler.put(Job(0, "u", Priority.URGENT), Job(1, "b", Priority.BULK))
+        self.drain(scheduler)
+        stats = scheduler.lane_stats()
+        assert [lane.priority for lane in stats] == [Priority.URGENT, Priority.BULK]
+        assert all(lane.started == 1 for lane in stats)
+        assert stats[0].met_target
+        assert "Urgent: 1 started" in str(stats[0])
+    
+    def test_urgent_job_preempts_running_batch(self, monkeypatch, tmp_path):
+        """Test that an urgent URL pauses a bulk download, which later resumes."""
+        FakeYoutubeDL.progress = {}
+        FakeYoutubeDL.finished = []
+        monkeypatch.setattr(main, "_yt_dlp", types.SimpleNamespace(YoutubeDL=FakeYoutubeDL))
+        engine = DownloaderEngine(str(tmp_path))
+        statuses = []
+        bulk = [f"bulk{i}" for i in range(3)]
+        
+        batch = threading.Thread(target=lambda: statuses.append(engine.download_videos(
+            bulk, "video", "720p", lambda *args: None,
+            lambda index, fields: statuses.append((index, fields['status'])),
+            priority=Priority.BULK
+        )))
+        batch.start()
+        
+        while FakeYoutubeDL.progress.get("bulk0", 0) < 5:
+            time.sleep(0.001)
+        assert engine.add_jobs(["urgent"], Priority.URGENT)
+        batch.join(10)
+        
+        results = statuses[-1]
+        assert results.succeeded == 4
+        assert FakeYoutubeDL.finished[0] == "urgent"
+        assert (0, JobStatus.PAUSED) in statuses
+        assert FakeYoutubeDL.progress["bulk0"] == FakeYoutubeDL.STEPS
+        assert engine.lane_stats()[0].priority == Priority.URGENT
+        assert not engine.add_jobs(["too late"])
+
+
+class TestCancelAndPause:
+    """Tests for cooperative pause and cancel of jobs and batches."""
+    
+    @pytest.fixture(autouse=True)
+    def fake_yt_dlp(self, monkeypatch, tmp_path):
+        """Download through FakeYoutubeDL into a temporary directory."""
+        FakeYoutubeDL.progress = {}
+        FakeYoutubeDL.finished = []
+        monkeypatch.setattr(main, "_yt_dlp", types.SimpleNamespace(YoutubeDL=FakeYoutubeDL))
+        self.download_dir = str(tmp_path)
+    
+    def run_batch(self, urls):
+        """Start a fake batch in a thread; return the engine, thread and updates."""
+        engine = DownloaderEngine(self.download_dir)
+        updates = []
+        batch = threading.Thread(target=lambda: updates.append(engine.download_videos(
+            urls, "video", "720p", lambda *args: None,
+            lambda index, fields: updates.append((index, fields['status']))
+        )))
+        batch.start()
+        return engine, batch, updates
+    
+    def wait_for_progress(self, url, steps=3):
+        """Wait until the fake download of url has made some progress."""
+        while FakeYoutubeDL.progress.get(url, 0) < steps:
+            time.sleep(0.001)
+    
+    def test_scheduler_holds_paused_job(self):
+        """Test that a held job keeps the batch open until released."""
+        scheduler = LaneScheduler()
+        job = Job(0, "a", Priority.NORMAL)
+        scheduler.put(job)
+        assert scheduler.get() is job
+        job.paused = True
+        scheduler.hold(job)
+        assert not scheduler.closed
+        job.paused = False
+        assert scheduler.release(job)
+        assert scheduler.get() is job
+        scheduler.task_done(job)
+        assert scheduler.get() is None
+    
+    def test_scheduler_cancel_returns_pending_jobs(self):
+        """Test that cancelling removes queued and held jobs."""
+        scheduler = LaneScheduler()
+        jobs = [Job(i, str(i), Priority.NORMAL) for i in range(3)]
+        scheduler.put(*jobs)
+        held = scheduler.get()
+        held.paused = True
+        scheduler.hold(held)
+        removed = scheduler.cancel()
+        assert sorted(job.index for job in removed) == [0, 1, 2]
+        assert scheduler.get() is None
+        assert not scheduler.put(Job(3, "late", Priority.NORMAL))
+    
+    def test_cancel_running_job(self):
+        """Test that cancelling a running job stops it and the batch carries on."""
+        engine, batch, updates = self.run_batch(["a", "b"])
+        self.wait_for_progress("a")
+        engine.cancel_job(0)
+        batch.join(10)
+        results = updates[-1]
+        assert (results.succeeded, results.cancelled) == (1, 1)
+        assert FakeYoutubeDL.finished == ["b"]
+        assert FakeYoutubeDL.progress["a"] < FakeYoutubeDL.STEPS
+    
+    def test_pause_and_resume_job(self):
+        """Test that a paused job resumes from where it stopped."""
+        engine, batch, updates = self.run_batch(["a", "b"])
+        self.wait_for_progress("a")
+        engine.pause_job(0)
+        while "b" not in FakeYoutubeDL.finished:
+            batch.join(0.01)
+        assert batch.is_alive()
+        assert (0, JobStatus.PAUSED) in updates
+        engine.resume_job(0)
+        batch.join(10)
+        assert updates[-1].succeeded == 2
+        assert FakeYoutubeDL.finished == ["b", "a"]
+        assert FakeYoutubeDL.progress["a"] == FakeYoutubeDL.STEPS
+    
+    def test_queued_job_withdrawn_immediately(self):
+        """Test that pausing or cancelling a queued job takes effect at once."""
+        engine, batch, updates = self.run_batch(["a", "b", "c"])
+        self.wait_for_progress("a")
+        assert engine.cancel_job(1)
+        assert engine.pause_job(2)
+        assert (1, JobStatus.CANCELLED) in updates
+        assert (2, JobStatus.PAUSED) in updates
+        assert engine.results.cancelled == 1
+        assert len(engine.scheduler) == 0
+        
+        engine.cancel_job(2)
+        batch.join(10)
+        results = updates[-1]
+        assert (results.succeeded, results.cancelled) == (1, 2)
+        assert engine.lane_stats()[0].started == 1
+    
+    def test_controls_ignore_other_batches(self):
+        """Test that job controls only act on the running batch's jobs."""
+        engine, batch, updates = self.run_batch(["a"])
+        assert not engine.pause_job(5)
+        batch.join(10)
+        assert updates[-1].succeeded == 1
+        assert not engine.cancel_job(0)
+        assert not engine.is_running()
+        engine.pause_all()
+        assert not engine.is_paused()
+    
+    def test_cancel_all(self):
+        """Test that cancelling the batch stops the running job and drops the rest."""
+        engine, batch, updates = self.run_batch(["a", "b", "c"])
+        self.wait_for_progress("a")
+        engine.pause_all()
+        assert engine.cancel_all() == [1, 2]
+        batch.join(10)
+        assert not batch.is_alive()
+        assert updates[-1].cancelled == 3
+        assert FakeYoutubeDL.finished == []
+
+
+class SlowHandler(http.server.BaseHTTPRequestHandler):
+    """Serves a large file as a slow trickle and records when the client hangs up."""
+    
+    SIZE = 10 * 1024 * 1024
+    CHUNK = 4096
+    stopped_at = None
+    
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "video/mp4")
+        self.send_header("Content-Length", str(self.SIZE))
+        self.end_headers()
+        try:
+            for _ in range(self.SIZE // self.CHUNK):
+                self.wfile.write(b"\0" * self.CHUNK)
+                self.wfile.flush()
+                time.sleep(0.02)
+        except OSError:
+            type(self).stopped_at = time.monotonic()
+    
+    def log_message(self, *args):
+        pass
+
+
+class TestSlowServerCancel:
+    """Tests for cancelling a real yt-dlp transfer from a slow local server."""
+    
+    def test_cancel_stops_transfer(self, tmp_path):
+        """
+        Cancelling a download from a slow local server stops the transfer
+        quickly and leaves a resumable .part file.
+        """
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/video.mp4"
+        
+        engine = DownloaderEngine(str(tmp_path))
+        downloading = threading.Event()
+        returned = []
+        
+        def on_job(index, fields):
+            if fields['status'] == JobStatus.DOWNLOADING:
+                downloading.set()
+        
+        batch = threading.Thread(target=lambda: returned.append(engine.download_videos(
+            [url], "video", "Best Available", lambda *args: None, on_job
+        )))
+        batch.start()
+        try:
+            assert downloading.wait(30)
+            time.sleep(0.5)
+            
+            # The extractor's probe request hangs up early too; only time the download
+            SlowHandler.stopped_at = None
+            cancelled_at = time.monotonic()
+            engine.cancel_job(0)
+            batch.join(10)
+            slot_released = time.monotonic() - cancelled_at
+            
+            deadline = time.monotonic() + 5
+            while SlowHandler.stopped_at is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert SlowHandler.stopped_at is not None, "server never saw the transfer stop"
+            transfer_stopped = SlowHandler.stopped_at - cancelled_at
+            
+            assert returned[0].cancelled == 1
+            assert slot_released < 3, f"slot released after {slot_released:.2f}s"
+            assert transfer_stopped < 3, f"transfer stopped after {transfer_stopped:.2f}s"
+            assert any(name.endswith(".part") for name in os.listdir(tmp_path))
+        finally:
+            server.shutdown()
+
+
+class TestUrlValidator:
+    """Tests for the incremental URL validator."""
+    
+    def test_classify_matches_engine(self):
+        """Test that cached classification agrees with validate_urls."""
+        engine = DownloaderEngine("test_downloads")
+        validator = UrlValidator(engine.is_valid_url)
+        urls = ["https://youtu.be/abc", "nope", " ", "https://youtu.be/abc"]
+        assert validator.classify(urls) == engine.validate_urls(urls)
+    
+    def test_classify_reuses_cache(self):
+        """Test that each distinct URL is only checked once."""
+        calls = []
+        validator = UrlValidator(lambda url: calls.append(url) or True)
+        validator.classify(["x", "y"])
+        validator.classify(["x", "y", "z"])
+        assert calls == ["x", "y", "z"]
+    
+    def test_submit_runs_in_background(self):
+        """Test that submit delivers results through the callback."""
+        done = threading.Event()
+        received = []
+        validator = UrlValidator(lambda url: url.startswith("ok"))
+        validator.submit("ok1\nbad\nok2", lambda v, i: (received.append((v, i)), done.set()))
+        assert done.wait(5)
+        assert received == [(["ok1", "ok2"], ["bad"])]
+
 
 class TestPropertyBased:
     """Property-based tests using Hypothesis."""